@@ -6,6 +6,7 @@ Phase 3: debug calls ApiExecutor.execute (SQL or SCRIPT).
 """
 
 import logging
+import re
 import uuid
 from datetime import UTC, datetime
 from typing import Any
@@ -25,7 +26,7 @@ from app.api.deps import (
 from app.api.pagination import get_allowed_ids, paginate
 from app.core.gateway.config_cache import invalidate_gateway_config, load_macros_for_api
 from app.core.gateway.request_response import normalize_api_result
-from app.core.gateway.resolver import invalidate_route_cache
+from app.core.gateway.resolver import invalidate_route_cache, path_to_regex
 from app.core.param_type import ParamTypeError, validate_and_coerce_params
 from app.core.param_validate import ParamValidateError, run_param_validates
 from app.core.permission_resources import (
@@ -114,7 +115,8 @@ def _assert_path_method_unique(
     """
     Ensure (path, http_method) is unique across all modules.
     Gateway URL is /api/{path}; one path+method must map to one API.
-    Raises HTTPException 400 if another API already uses this path+method.
+    Raises HTTPException 400 if another API already uses this path+method,
+    or if the path pattern cannot be compiled for the gateway.
     """
     norm = _normalize_path(path)
     if not norm:
@@ -122,6 +124,15 @@ def _assert_path_method_unique(
             status_code=400,
             detail="API path cannot be empty.",
         )
+    # Compile on write: warms the resolver's pattern cache and rejects patterns
+    # (e.g. a repeated {name}) that the route table would otherwise skip.
+    try:
+        path_to_regex(norm)
+    except re.error:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid API path '{norm}': path param names must be unique.",
+        )
     stmt = select(ApiAssignment).where(
         ApiAssignment.path == norm,
         ApiAssignment.http_method == http_method,
@@ -17,12 +17,12 @@ import logging
 import time
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
 from sqlmodel import Session
 
 from app.core.config import settings
 from app.core.db import engine
 from app.core.gateway import (
+    GatewayJSONResponse,
     acquire_concurrent_slot,
     check_firewall,
     check_rate_limit,
@@ -81,6 +81,7 @@ def _gateway_pipeline(
     headers: dict[str, str],
     query: dict[str, str],
     body: dict,
+    body_text: str | None,
     gateway_start: float,
 ) -> dict:
     """Run the entire gateway pipeline synchronously.
@@ -152,6 +153,7 @@ def _gateway_pipeline(
                 headers,
                 method,
                 params_definition=params_definition,
+                body_text=body_text,
             )
 
             # 8. Serialize request metadata for access log
@@ -206,7 +208,7 @@ def _gateway_pipeline(
 async def gateway_proxy(
     path: str,
     request: Request,
-) -> JSONResponse:
+) -> GatewayJSONResponse:
     """
     Dynamic gateway: resolve /api/{path} to ApiAssignment, run SQL/Script, return JSON.
 
@@ -224,7 +226,7 @@ async def gateway_proxy(
     naming = get_response_naming(query, headers)
 
     # Pre-read body — the only truly async I/O in the handler
-    body = await _read_body(request)
+    body, body_text = await _read_body(request)
 
     # --- Run the entire sync pipeline in a worker thread ---
     try:
@@ -237,17 +239,18 @@ async def gateway_proxy(
             headers=headers,
             query=query,
             body=body,
+            body_text=body_text,
             gateway_start=gateway_start,
         )
     except _GatewayAbort as abort:
         error_body = {"success": False, "message": abort.detail, "data": []}
-        return JSONResponse(
+        return GatewayJSONResponse(
             status_code=abort.status_code,
             content=format_response(error_body, naming),
         )
     except HTTPException as he:
         error_body = {"success": False, "message": str(he.detail), "data": []}
-        return JSONResponse(
+        return GatewayJSONResponse(
             status_code=he.status_code,
             content=format_response(error_body, naming),
         )
@@ -257,10 +260,10 @@ async def gateway_proxy(
         if settings.ENVIRONMENT == "local":
             detail = str(e)
         error_body = {"success": False, "message": detail, "data": []}
-        return JSONResponse(
+        return GatewayJSONResponse(
             status_code=500,
             content=format_response(error_body, naming),
         )
 
     normalized = normalize_api_result(out["_result"], out["_engine"])
-    return JSONResponse(content=format_response(normalized, naming))
+    return GatewayJSONResponse(content=format_response(normalized, naming))
@@ -7,6 +7,7 @@ from app.core.gateway.concurrent import acquire_concurrent_slot, release_concurr
 from app.core.gateway.firewall import check_firewall
 from app.core.gateway.ratelimit import check_rate_limit
 from app.core.gateway.request_response import (
+    GatewayJSONResponse,
     format_response,
     get_response_naming,
     keys_to_camel,
@@ -23,6 +24,7 @@ from app.core.gateway.resolver import (
 from app.core.gateway.runner import run as run_api
 
 __all__ = [
+    "GatewayJSONResponse",
     "acquire_concurrent_slot",
     "check_firewall",
     "check_rate_limit",
@@ -9,6 +9,7 @@ returns True (allow). This avoids blocking traffic when Redis is down.
 To fail closed (reject on Redis error), you would need a separate config.
 """
 
+import collections
 import os
 import threading
 import time
@@ -17,10 +18,13 @@ from app.core.config import settings
 from app.core.redis_client import get_redis
 
 _REDIS_KEY_PREFIX = "ratelimit:gateway:"
-_memory: dict[str, list[float]] = {}
+# In-memory fallback: {key: deque of monotonic_ns timestamps, oldest first}.
+# Monotonic (not wall-clock) ints: immune to clock jumps, no float boxing.
+_memory: dict[str, collections.deque[int]] = {}
 _memory_lock = threading.Lock()
-_memory_last_gc: float = 0.0
-_MEMORY_GC_INTERVAL = 60.0
+_memory_last_gc: int = 0
+_NS_PER_SEC = 1_000_000_000
+_MEMORY_GC_INTERVAL_NS = 60 * _NS_PER_SEC
 
 
 _RATE_LIMIT_SCRIPT = """\
@@ -65,31 +69,32 @@ def _check_redis(key: str, limit: int, window_sec: float, r: "redis.Redis") -> b
         return True  # fail-open
 
 
-def _gc_memory() -> None:
+def _gc_memory(now: int) -> None:
     """Remove empty or fully-expired keys from in-memory store."""
     global _memory_last_gc
-    now = time.time()
-    if (now - _memory_last_gc) < _MEMORY_GC_INTERVAL:
+    if (now - _memory_last_gc) < _MEMORY_GC_INTERVAL_NS:
         return
     _memory_last_gc = now
-    cutoff = now - 60.0
-    dead = [k for k, v in _memory.items() if not v or v[-1] < cutoff]
+    cutoff = now - 60 * _NS_PER_SEC
+    dead = [k for k, v in _memory.items() if not v or v[-1] <= cutoff]
     for k in dead:
         _memory.pop(k, None)
 
 
 def _check_memory(key: str, limit: int, window_sec: float) -> bool:
-    now = time.time()
-    cutoff = now - window_sec
+    now = time.monotonic_ns()
+    cutoff = now - int(window_sec * _NS_PER_SEC)
     with _memory_lock:
-        arr = _memory.get(key, [])
-        arr = [t for t in arr if t > cutoff]
-        if len(arr) >= limit:
-            _memory[key] = arr
+        dq = _memory.get(key)
+        if dq is None:
+            dq = _memory[key] = collections.deque()
+        # Timestamps are appended in order, so expired ones are at the left
+        while dq and dq[0] <= cutoff:
+            dq.popleft()
+        if len(dq) >= limit:
             return False
-        arr.append(now)
-        _memory[key] = arr
-        _gc_memory()
+        dq.append(now)
+        _gc_memory(now)
         return True
 
 
@@ -102,7 +107,7 @@ def check_rate_limit(key: str, limit: int | None = None) -> bool:
     - Sliding window: limit requests per 60 seconds.
     - Redis: atomic sliding-window via sorted set (single Lua script).
     - Falls back to in-memory on Redis error/unavailable.
-    - In-memory: dict of timestamps; not shared across processes.
+    - In-memory: dict of monotonic timestamps; not shared across processes.
     """
     if not settings.FLOW_CONTROL_RATE_LIMIT_ENABLED:
         return True
@@ -4,78 +4,191 @@ Gateway request/response (Phase 4, Task 4.3): parse_params, keys_to_snake, keys_
 - parse_params: merge path, query, body (path > query > body); optional camel→snake for body/query.
   Returns (params, body_for_log) for AccessRecord when GATEWAY_ACCESS_LOG_BODY.
 - format_response: optional snake→camel for result; always JSON-serializable structure.
+- GatewayJSONResponse: renders with orjson when installed (stdlib json fallback).
 """
 
 import functools
+import itertools
 import json
 import re
 import uuid
+from collections.abc import Callable
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-from typing import Any
+from typing import Any, cast
+from urllib.parse import parse_qsl
 
 from starlette.requests import Request
+from starlette.responses import JSONResponse
 
 from app.core.config import settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Compiled once at import; the lru_caches below keep per-key work to a lookup.
 _CAMEL_TO_SNAKE_RE = re.compile(r"(?<!^)(?=[A-Z])")
 
 
 @functools.lru_cache(maxsize=1024)
 def _to_snake_str(s: str) -> str:
     """camelCase → snake_case. E.g. userId → user_id, firstName → first_name."""
-    return _CAMEL_TO_SNAKE_RE.sub("_", str(s)).lower()
+    s = str(s)
+    if s.islower():
+        # No uppercase letters: nothing to split
+        return s
+    return _CAMEL_TO_SNAKE_RE.sub("_", s).lower()
 
 
 @functools.lru_cache(maxsize=1024)
 def _to_camel_str(s: str) -> str:
     """snake_case → camelCase. E.g. user_id → userId, first_name → firstName."""
-    parts = str(s).split("_")
-    if not parts:
-        return ""
+    s = str(s)
+    if "_" not in s:
+        return s.lower()
+    parts = s.split("_")
     return parts[0].lower() + "".join(p.capitalize() for p in parts[1:])
 
 
-def keys_to_snake(obj: Any) -> Any:
+def _convert_keys(obj: Any, convert: Callable[[str], str]) -> Any:
     """
-    Recursively convert dict keys from camelCase to snake_case.
-    Lists: recurse into items. Other values: unchanged.
+    Recursively apply *convert* to dict keys (lists: recurse into items).
+
+    Copy-on-write: a dict or list is only rebuilt once a key or nested value
+    actually changes, so input already in the target case is returned as-is.
     """
     if isinstance(obj, dict):
-        return {_to_snake_str(k): keys_to_snake(v) for k, v in obj.items()}
+        out_d: dict[Any, Any] | None = None
+        for i, (k, v) in enumerate(obj.items()):
+            nk = convert(k)
+            nv = _convert_keys(v, convert)
+            if out_d is None:
+                if nk == k and nv is v:
+                    continue
+                out_d = dict(itertools.islice(obj.items(), i))
+            out_d[nk] = nv
+        return obj if out_d is None else out_d
     if isinstance(obj, list):
-        return [keys_to_snake(x) for x in obj]
+        out_l: list[Any] | None = None
+        for i, item in enumerate(obj):
+            ni = _convert_keys(item, convert)
+            if ni is not item:
+                if out_l is None:
+                    out_l = list(obj)
+                out_l[i] = ni
+        return obj if out_l is None else out_l
     return obj
 
 
+def keys_to_snake(obj: Any) -> Any:
+    """
+    Recursively convert dict keys from camelCase to snake_case.
+    Lists: recurse into items. Other values: unchanged.
+    Returns *obj* itself when no key needs converting.
+    """
+    return _convert_keys(obj, _to_snake_str)
+
+
 def keys_to_camel(obj: Any) -> Any:
     """
     Recursively convert dict keys from snake_case to camelCase.
     Lists: recurse into items. Other values: unchanged.
+    Returns *obj* itself when no key needs converting.
     """
-    if isinstance(obj, dict):
-        return {_to_camel_str(k): keys_to_camel(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [keys_to_camel(x) for x in obj]
-    return obj
+    return _convert_keys(obj, _to_camel_str)
+
 
+def _content_type(request: Request) -> bytes:
+    """Media type of the request (parameters stripped, lower-cased), as raw bytes.
 
-async def _read_body(request: Request) -> dict[str, Any]:
-    """Read JSON or form body; return {} on no body or unsupported type."""
-    ct = (request.headers.get("content-type") or "").split(";")[0].strip().lower()
-    if ct == "application/json":
+    Scans the ASGI scope headers directly instead of going through the
+    decoded ``request.headers`` view.
+    """
+    raw_headers = cast(list[tuple[bytes, bytes]], request.scope.get("headers") or [])
+    for k, v in raw_headers:
+        if k == b"content-type":
+            return v.split(b";", 1)[0].strip().lower()
+    return b""
+
+
+async def _read_body(request: Request) -> tuple[dict[str, Any], str | None]:
+    """
+    Read JSON or form body; ``({}, None)`` on no body or unsupported type.
+
+    Returns ``(body, body_text)``.  For JSON, *body_text* is the raw request
+    body decoded as UTF-8 so callers can log it without re-serializing
+    *body*; it is ``None`` for form bodies.
+    """
+    ct = _content_type(request)
+    if ct == b"application/json":
         try:
-            raw = await request.json()
+            raw_body = await request.body()
+            raw = json.loads(raw_body)
         except Exception:
-            return {}
-        return raw if isinstance(raw, dict) else {}
-    if ct in ("application/x-www-form-urlencoded", "multipart/form-data"):
+            return {}, None
+        if not isinstance(raw, dict):
+            return {}, None
+        return raw, raw_body.decode("utf-8", errors="replace")
+    if ct == b"application/x-www-form-urlencoded":
+        # Plain k=v pairs: parse directly instead of building a FormData multidict
+        try:
+            raw_body = await request.body()
+            return (
+                dict(parse_qsl(raw_body.decode("utf-8"), keep_blank_values=True)),
+                None,
+            )
+        except Exception:
+            return {}, None
+    if ct == b"multipart/form-data":
         try:
             form = await request.form()
-            return dict(form)
+            return dict(form), None
         except Exception:
-            return {}
-    return {}
+            return {}, None
+    return {}, None
+
+
+# Normalized (name, location) pairs per params_definition list, keyed by id().
+# Gateway configs are cached (config_cache), so the same list object is reused
+# across requests; the list itself is kept in the entry so its id cannot be
+# recycled while cached.
+_PARAM_LOCATIONS_CACHE: dict[
+    int, tuple[list[dict[str, Any]], tuple[tuple[str, str], ...]]
+] = {}
+_PARAM_LOCATIONS_MAX_SIZE = 1024
+
+
+def _param_locations(
+    params_definition: list[dict[str, Any]],
+) -> tuple[tuple[str, str], ...]:
+    """Return ``(name, location)`` pairs for *params_definition*, normalized once.
+
+    Names are stripped; locations are lower-cased and default to ``"query"``.
+    Entries without a usable name are dropped.
+    """
+    key = id(params_definition)
+    entry = _PARAM_LOCATIONS_CACHE.get(key)
+    if entry is not None and entry[0] is params_definition:
+        return entry[1]
+
+    pairs: list[tuple[str, str]] = []
+    for param_def in params_definition:
+        if not isinstance(param_def, dict):
+            continue
+        name = param_def.get("name")
+        if not isinstance(name, str) or not name.strip():
+            continue
+        loc = param_def.get("location") or "query"
+        loc = loc.strip().lower() if isinstance(loc, str) else "query"
+        pairs.append((name.strip(), loc))
+
+    locations = tuple(pairs)
+    if len(_PARAM_LOCATIONS_CACHE) >= _PARAM_LOCATIONS_MAX_SIZE:
+        _PARAM_LOCATIONS_CACHE.clear()
+    _PARAM_LOCATIONS_CACHE[key] = (params_definition, locations)
+    return locations
 
 
 def merge_params(
@@ -85,6 +198,7 @@ def merge_params(
     headers: dict[str, str],
     http_method: str,  # noqa: ARG001 reserved for future (e.g. skip body for GET)
     params_definition: list[dict[str, Any]] | None = None,
+    body_text: str | None = None,
 ) -> tuple[dict[str, Any], str | None]:
     """
     Merge path, query, body, and header into a single params dict for ApiExecutor.
@@ -101,6 +215,9 @@ def merge_params(
     Naming: determined by the ``naming`` key in *query* (``"snake"`` by
     default, ``"camel"`` converts body/query keys to snake_case).
 
+    *body_text*: raw request body as read by ``_read_body``; used as-is for
+    body_for_log instead of re-serializing *body*.
+
     Returns: (params for ApiExecutor, body_for_log JSON string or None).
     """
     naming_req = (query.get("naming") or "snake").strip().lower()
@@ -119,32 +236,16 @@ def merge_params(
     out: dict[str, Any] = dict(path_params)
 
     if params_definition:
-        # Case-insensitive header lookup map
-        headers_ci: dict[str, str] = {k.lower(): v for k, v in headers.items()}
-
-        def _get_header_value(name: str) -> str | None:
-            if not name:
-                return None
-            v = headers.get(name)
-            if v is not None:
-                return v
-            return headers_ci.get(name.lower())
-
-        for param_def in params_definition:
-            if not isinstance(param_def, dict):
-                continue
-            name = param_def.get("name")
-            if not isinstance(name, str) or not name.strip():
-                continue
-            name = name.strip()
-            loc = param_def.get("location") or "query"
-            if isinstance(loc, str):
-                loc = loc.strip().lower()
-            else:
-                loc = "query"
+        # Case-insensitive header lookup map (built only on a case mismatch)
+        headers_ci: dict[str, str] | None = None
 
+        for name, loc in _param_locations(params_definition):
             if loc == "header":
-                hv = _get_header_value(name)
+                hv = headers.get(name)
+                if hv is None:
+                    if headers_ci is None:
+                        headers_ci = {k.lower(): v for k, v in headers.items()}
+                    hv = headers_ci.get(name.lower())
                 if hv is not None:
                     out[name] = hv
                 continue
@@ -167,7 +268,9 @@ def merge_params(
         out.update(path_params)
 
     body_for_log: str | None = None
-    if body:
+    if body and body_text is not None:
+        body_for_log = body_text
+    elif body:
         try:
             body_for_log = json.dumps(body, default=str)
         except Exception:
@@ -188,10 +291,16 @@ async def parse_params(
     have an ASGI Request object.
     """
     query = dict(request.query_params)
-    body = await _read_body(request)
+    body, body_text = await _read_body(request)
     headers = dict(request.headers)
     return merge_params(
-        query, body, path_params, headers, http_method, params_definition
+        query,
+        body,
+        path_params,
+        headers,
+        http_method,
+        params_definition,
+        body_text=body_text,
     )
 
 
@@ -322,11 +431,6 @@ def get_response_naming(query: dict[str, Any], headers: dict[str, str]) -> str:
 _JSON_SAFE_TYPES = (bool, int, float, str, type(None))
 
 
-def _row_already_safe(row: dict) -> bool:
-    """True if all values in a dict are JSON-safe primitives (no conversion needed)."""
-    return all(isinstance(v, _JSON_SAFE_TYPES) for v in row.values())
-
-
 def _make_json_safe(obj: Any, camel: bool = False) -> Any:
     """Recursively convert non-JSON-serializable types to safe primitives.
 
@@ -335,7 +439,9 @@ def _make_json_safe(obj: Any, camel: bool = False) -> Any:
     when DB rows contain native Python date/time or Decimal values.
 
     When *camel* is ``True``, dict keys are also converted to camelCase in the
-    same pass, avoiding a second recursive traversal.
+    same pass, avoiding a second recursive traversal.  Dicts whose keys need
+    no conversion, and lists, are copied only when a value actually changes,
+    so an already JSON-safe structure is returned as-is after a single walk.
     """
     if isinstance(obj, _JSON_SAFE_TYPES):
         return obj
@@ -357,22 +463,32 @@ def _make_json_safe(obj: Any, camel: bool = False) -> Any:
     if isinstance(obj, bytes):
         return obj.decode("utf-8", errors="replace")
     if isinstance(obj, dict):
-        # Fast path: if all values are already primitives and no key conversion needed
-        if not camel and _row_already_safe(obj):
-            return obj
-        return {
-            (_to_camel_str(k) if camel else k): _make_json_safe(v, camel)
-            for k, v in obj.items()
-        }
-    if isinstance(obj, (list, tuple)):
-        # Fast path for list of dicts (common data rows): skip recursion when safe
-        if (
-            not camel
-            and obj
-            and isinstance(obj[0], dict)
-            and all(isinstance(row, dict) and _row_already_safe(row) for row in obj)
-        ):
-            return list(obj) if isinstance(obj, tuple) else obj
+        if camel and any(_to_camel_str(k) != k for k in obj):
+            return {_to_camel_str(k): _make_json_safe(v, True) for k, v in obj.items()}
+        # Keys unchanged: copy-on-write on values.  dict(obj) clones at the
+        # source size in one allocation instead of growing a new table.
+        out_d: dict[Any, Any] | None = None
+        for k, v in obj.items():
+            if isinstance(v, _JSON_SAFE_TYPES):
+                continue
+            nv = _make_json_safe(v, camel)
+            if nv is not v:
+                if out_d is None:
+                    out_d = dict(obj)
+                out_d[k] = nv
+        return obj if out_d is None else out_d
+    if isinstance(obj, list):
+        out_l: list[Any] | None = None
+        for i, item in enumerate(obj):
+            if isinstance(item, _JSON_SAFE_TYPES):
+                continue
+            ni = _make_json_safe(item, camel)
+            if ni is not item:
+                if out_l is None:
+                    out_l = list(obj)
+                out_l[i] = ni
+        return obj if out_l is None else out_l
+    if isinstance(obj, tuple):
         return [_make_json_safe(item, camel) for item in obj]
     if isinstance(obj, set):
         return [_make_json_safe(item, camel) for item in sorted(obj, key=str)]
@@ -390,7 +506,26 @@ def format_response(
     *naming*: ``"camel"`` converts keys to camelCase; ``"snake"`` (default) leaves as-is.
 
     Always ensures the output is JSON-safe (datetime, Decimal, UUID etc. are converted).
+    With ``"snake"`` naming an already JSON-safe *result* is returned unchanged
+    (same object), without rebuilding the envelope or the rows.
     """
     if not isinstance(result, dict):
         return _make_json_safe(result)
     return _make_json_safe(result, camel=(naming == "camel"))
+
+
+class GatewayJSONResponse(JSONResponse):
+    """JSONResponse that serializes with orjson when available.
+
+    Content is expected to come from :func:`format_response` (already
+    JSON-safe).  Falls back to the stdlib encoder when orjson is not
+    installed or rejects the content (e.g. integers wider than 64 bits).
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                pass
+        return super().render(content)
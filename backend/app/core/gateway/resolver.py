@@ -9,6 +9,7 @@ regex compilation on every request.  Call ``invalidate_route_cache()`` when
 modules or API assignments change.
 """
 
+import collections
 import functools
 import logging
 import re
@@ -16,7 +17,7 @@ import threading
 import time
 from uuid import UUID
 
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, joinedload
 from sqlmodel import Session, select
 
 from app.core.config import settings
@@ -26,47 +27,229 @@ _log = logging.getLogger(__name__)
 
 _ROUTE_CACHE_TTL: float = float(settings.GATEWAY_ROUTE_CACHE_TTL_SECONDS)
 
-_RouteEntry = tuple[re.Pattern[str], str, ApiAssignment, ApiModule]
-
 # Two-tier route index: static routes (O(1) dict lookup) and dynamic routes
-# (per-method lists, reduced linear scan).
+# (per-method segment trie, plus a scan list for patterns the trie cannot
+# express, e.g. a placeholder embedded in a segment like "file-{id}.json",
+# plus one combined regex for segments holding several params).
 _StaticRoutes = dict[
     tuple[str, str], tuple[ApiAssignment, ApiModule]
 ]  # (method, path) → (api, mod)
-_DynamicEntry = tuple[re.Pattern[str], ApiAssignment, ApiModule]
-_DynamicRoutes = dict[str, list[_DynamicEntry]]  # method → [(regex, api, mod), ...]
+# (priority, param names in path order, api, mod); lower priority wins
+_TrieLeaf = tuple[int, tuple[str, ...], ApiAssignment, ApiModule]
+# One pattern segment: literal text, or (prefix, param name, suffix)
+_Segment = str | tuple[str, str, str]
+# (priority, literal prefix before the first "{", segments, api, mod)
+_ScanEntry = tuple[int, str, tuple[_Segment, ...], ApiAssignment, ApiModule]
+
+
+class _TrieNode:
+    """One path segment level: literal children, one param child, optional leaf."""
+
+    __slots__ = ("static", "param", "leaf")
+
+    def __init__(self) -> None:
+        self.static: dict[str, _TrieNode] = {}
+        self.param: _TrieNode | None = None
+        self.leaf: _TrieLeaf | None = None
+
+
+_DynamicHit = tuple[ApiAssignment, dict[str, str], ApiModule]
+
+# Per-method bound on memoised dynamic resolutions (concrete path → hit)
+_HIT_CACHE_MAX_SIZE = 2048
+
+
+class _MethodRoutes:
+    """Dynamic routes for one HTTP method.
+
+    ``scan`` and ``combined`` are keyed by segment count: params never span
+    "/", so only patterns with the request's segment count can match.
+    ``hits`` memoises resolved concrete paths.  It lives on the route table,
+    so a rebuild or ``invalidate_route_cache()`` drops it with the table.
+    """
+
+    __slots__ = ("trie", "scan", "combined", "hits", "hits_lock")
+
+    def __init__(self) -> None:
+        self.trie = _TrieNode()
+        self.scan: dict[int, list[_ScanEntry]] = {}
+        # Regex-only routes as one alternation (+ its leaves, in order); the
+        # k-th alternative ends in an empty group "_k" (see _combine_patterns).
+        self.combined: dict[int, tuple[re.Pattern[str], list[_TrieLeaf]]] = {}
+        self.hits: collections.OrderedDict[str, _DynamicHit] = collections.OrderedDict()
+        self.hits_lock = threading.Lock()
+
+
+_DynamicRoutes = dict[str, _MethodRoutes]  # method → routes with path params
 _RouteIndex = tuple[_StaticRoutes, _DynamicRoutes]
 
+_HTTP_METHODS = frozenset(m.value for m in HttpMethodEnum)
+
 _route_cache: _RouteIndex | None = None
 _route_cache_ts: float = 0.0
 _route_cache_lock = threading.Lock()
 
 
-@functools.lru_cache(maxsize=1024)
+# Splits a path pattern into literal text and "{...}" placeholders (kept).
+_PLACEHOLDER_SPLIT_RE = re.compile(r"(\{[^}]+\})")
+_PLACEHOLDER_RE = re.compile(r"\{[^}]+\}")
+
+
+@functools.lru_cache(maxsize=4096)
 def path_to_regex(pattern: str) -> re.Pattern[str]:
     """
     Convert path pattern to regex. {name} -> (?P<name>[^/]+); rest escaped.
-    E.g. "users/{id}" -> ^users/(?P<id>[^/]+)$; "list" -> ^list$
+    E.g. "users/{id}" -> \\Ausers/(?P<id>[^/]+)\\Z; "list" -> \\Alist\\Z
+    (``\\Z``, unlike ``$``, does not also match before a trailing newline).
+
+    Cached per pattern, so route table rebuilds reuse compiled regexes.
     """
+    return re.compile(r"\A" + _regex_body(pattern) + r"\Z", re.ASCII)
+
+
+def _regex_body(pattern: str, group_prefix: str = "") -> str:
+    """Unanchored regex source for ``pattern``; groups named ``group_prefix + name``."""
     parts: list[str] = []
-    for seg in re.split(r"(\{[^}]+\})", pattern):
-        if re.match(r"^\{[^}]+\}$", seg):
+    for seg in _PLACEHOLDER_SPLIT_RE.split(pattern):
+        if _PLACEHOLDER_RE.fullmatch(seg):
             name = seg[1:-1]
             parts.append(
-                f"(?P<{name}>[^/]+)" if name.isidentifier() else re.escape(seg)
+                f"(?P<{group_prefix}{name}>[^/]+)"
+                if name.isidentifier()
+                else re.escape(seg)
             )
         else:
             parts.append(re.escape(seg))
-    return re.compile("^" + "".join(parts) + "$")
+    return "".join(parts)
+
+
+def _combine_patterns(api_paths: list[str]) -> re.Pattern[str]:
+    """
+    One anchored alternation over ``api_paths``, in order: the first matching
+    alternative wins, as in an ordered scan.  Alternative ``k`` names its
+    params ``_k_<name>`` and ends with an empty ``(?P<_k>)`` group, so
+    ``m.lastgroup`` identifies it.
+    """
+    alternatives = [
+        f"{_regex_body(api_path, f'_{k}_')}(?P<_{k}>)"
+        for k, api_path in enumerate(api_paths)
+    ]
+    return re.compile(r"\A(?:" + "|".join(alternatives) + r")\Z", re.ASCII)
+
+
+def _split_pattern(api_path: str) -> list[_Segment] | None:
+    """
+    Split a path pattern into segments: literal text, or ``(prefix, name,
+    suffix)`` for a segment holding one ``{name}`` param (whole-segment
+    params have empty prefix and suffix).  Tokenises exactly like
+    ``path_to_regex``.  Returns ``None`` when a segment holds several params
+    (only the regex can match those).
+    """
+    segments: list[list[str]] = [[]]  # literal pieces and param names, per segment
+    param_at: list[int] = [-1]  # per segment: index of its param piece, or -1
+    for i, token in enumerate(_PLACEHOLDER_SPLIT_RE.split(api_path)):
+        name = token[1:-1]
+        if i % 2 and name.isidentifier():
+            if param_at[-1] >= 0:
+                return None
+            param_at[-1] = len(segments[-1])
+            segments[-1].append(name)
+            continue
+        # Literal text (or a non-identifier "{...}", matched literally)
+        first, *rest = token.split("/")
+        segments[-1].append(first)
+        for part in rest:
+            segments.append([part])
+            param_at.append(-1)
+    result: list[_Segment] = []
+    for pieces, at in zip(segments, param_at, strict=True):
+        if at < 0:
+            result.append("".join(pieces))
+        else:
+            result.append(("".join(pieces[:at]), pieces[at], "".join(pieces[at + 1 :])))
+    return result
+
+
+def _is_trie_shape(segments: list[_Segment]) -> bool:
+    """True when every param fills its whole segment."""
+    return all(isinstance(seg, str) or seg[0] == seg[2] == "" for seg in segments)
+
+
+def _trie_insert(root: _TrieNode, segments: list[_Segment], leaf: _TrieLeaf) -> None:
+    node = root
+    for seg in segments:
+        if not isinstance(seg, str):
+            if node.param is None:
+                node.param = _TrieNode()
+            node = node.param
+        else:
+            child = node.static.get(seg)
+            if child is None:
+                child = node.static[seg] = _TrieNode()
+            node = child
+    # Same shape already registered by a higher-priority route: keep it
+    if node.leaf is None:
+        node.leaf = leaf
+
+
+def _match_segments(
+    spec: tuple[_Segment, ...], segs: list[str]
+) -> dict[str, str] | None:
+    """
+    Match request segments against a pattern spec of equal length, with plain
+    string tests: same result as the pattern's regex, without the regex engine.
+    """
+    params: dict[str, str] = {}
+    for pat, seg in zip(spec, segs, strict=True):
+        if isinstance(pat, str):
+            if pat != seg:
+                return None
+            continue
+        prefix, name, suffix = pat
+        end = len(seg) - len(suffix)
+        if end <= len(prefix) or not (seg.startswith(prefix) and seg.endswith(suffix)):
+            return None
+        params[name] = seg[len(prefix) : end]
+    return params
+
+
+def _trie_match(
+    node: _TrieNode,
+    segs: list[str],
+    i: int,
+    values: list[str],
+    best: tuple[_TrieLeaf, tuple[str, ...]] | None,
+) -> tuple[_TrieLeaf, tuple[str, ...]] | None:
+    """
+    Depth-first walk returning the matching leaf with the lowest priority
+    (and its captured param values), so results equal a priority-ordered scan.
+    """
+    if i == len(segs):
+        leaf = node.leaf
+        if leaf is not None and (best is None or leaf[0] < best[0][0]):
+            return (leaf, tuple(values))
+        return best
+    seg = segs[i]
+    child = node.static.get(seg)
+    if child is not None:
+        best = _trie_match(child, segs, i + 1, values, best)
+    if node.param is not None and seg:
+        values.append(seg)
+        best = _trie_match(node.param, segs, i + 1, values, best)
+        values.pop()
+    return best
 
 
 def _build_route_table(
     session: Session,
 ) -> _RouteIndex:
-    """Build two-tier route index with a single JOIN query, sorted by priority.
+    """Build two-tier route index with a single query, sorted by priority.
 
     Static routes (no ``{param}``) go into a dict for O(1) lookup.
-    Dynamic routes (with path params) go into per-method lists.
+    Dynamic routes (with path params) go into a per-method segment trie;
+    patterns with a param inside a segment go into a per-method scan list
+    (plain string matching; regex only for segments with several params).
+    Each dynamic route keeps its ORDER BY position as its priority.
 
     Eagerly loads the ``datasource`` relationship on each ApiAssignment so
     the cached objects can be used directly without a session, avoiding two
@@ -77,8 +260,10 @@ def _build_route_table(
         .join(ApiModule, ApiAssignment.module_id == ApiModule.id)
         .where(ApiModule.is_active.is_(True), ApiAssignment.is_published.is_(True))
         .options(
-            selectinload(ApiAssignment.datasource),
-            selectinload(ApiAssignment.module),
+            # Fill both relationships from this one statement: module from the
+            # existing JOIN, datasource via LEFT OUTER JOIN (may be NULL).
+            contains_eager(ApiAssignment.module),
+            joinedload(ApiAssignment.datasource),
         )
         .order_by(
             ApiModule.sort_order.asc(),
@@ -90,8 +275,10 @@ def _build_route_table(
     rows = session.exec(stmt).all()
     static: _StaticRoutes = {}
     dynamic: _DynamicRoutes = {}
+    # (method, segment count) → [(api_path, leaf)] for regex-only patterns
+    regex_only: dict[tuple[str, int], list[tuple[str, _TrieLeaf]]] = {}
     expunged_mod_ids: set[UUID] = set()
-    for api, mod in rows:
+    for priority, (api, mod) in enumerate(rows):
         api_path = (api.path or "").strip("/")
         method_val = (
             api.http_method.value
@@ -115,7 +302,27 @@ def _build_route_table(
                 rx = path_to_regex(api_path)
             except re.error:
                 continue
-            dynamic.setdefault(method_val, []).append((rx, api, mod))
+            routes = dynamic.get(method_val)
+            if routes is None:
+                routes = dynamic[method_val] = _MethodRoutes()
+            segments = _split_pattern(api_path)
+            depth = api_path.count("/") + 1
+            leaf = (priority, tuple(rx.groupindex), api, mod)
+            if segments is None:
+                regex_key = (method_val, depth)
+                regex_only.setdefault(regex_key, []).append((api_path, leaf))
+            elif _is_trie_shape(segments):
+                _trie_insert(routes.trie, segments, leaf)
+            else:
+                prefix = api_path[: api_path.index("{")]
+                routes.scan.setdefault(depth, []).append(
+                    (priority, prefix, tuple(segments), api, mod)
+                )
+    for (method_val, depth), entries in regex_only.items():
+        dynamic[method_val].combined[depth] = (
+            _combine_patterns([api_path for api_path, _ in entries]),
+            [leaf for _, leaf in entries],
+        )
     return static, dynamic
 
 
@@ -179,6 +386,40 @@ def invalidate_route_cache() -> None:
         _route_cache_rebuilding = False
 
 
+def _match_dynamic(routes: _MethodRoutes, path: str) -> _DynamicHit | None:
+    """Match ``path`` against one method's trie, scan list and combined regex."""
+    segs = path.split("/")
+    found = _trie_match(routes.trie, segs, 0, [], None)
+    best: _DynamicHit | None = None
+    best_priority: int | None = None
+    if found is not None:
+        (best_priority, names, api, mod), values = found
+        best = (api, dict(zip(names, values, strict=True)), mod)
+    depth = len(segs)
+    for priority, prefix, spec, api, mod in routes.scan.get(depth, ()):
+        if best_priority is not None and priority > best_priority:
+            break
+        # Cheap literal-prefix test before matching segment by segment
+        if not path.startswith(prefix):
+            continue
+        params = _match_segments(spec, segs)
+        if params is not None:
+            best_priority, best = priority, (api, params, mod)
+            break
+    combined = routes.combined.get(depth)
+    if combined is not None and (
+        best_priority is None or combined[1][0][0] < best_priority
+    ):
+        rx, leaves = combined
+        m = rx.match(path)
+        if m is not None:
+            tag = m.lastgroup or ""  # "_<k>": the matching alternative
+            priority, names, api, mod = leaves[int(tag[1:])]
+            if best_priority is None or priority < best_priority:
+                return (api, {n: m.group(f"{tag}_{n}") for n in names}, mod)
+    return best
+
+
 def resolve_gateway_api(
     path: str,
     method: str,
@@ -188,16 +429,17 @@ def resolve_gateway_api(
     Resolve /api/{path} to (ApiAssignment, path_params, ApiModule).
 
     Uses a two-tier cached index: O(1) dict lookup for static routes,
-    then per-method linear scan for dynamic routes with path params.
+    then a per-method segment trie for dynamic routes with path params
+    (linear scan for params embedded inside a segment, one combined regex
+    for segments holding several params).  Dynamic hits
+    are memoised per concrete path in a bounded LRU on the route table.
     Returns detached objects from cache — no per-request DB queries.
     """
     path = (path or "").strip().strip("/")
     if not path:
         return None
     method_upper = (method or "GET").upper()
-    try:
-        HttpMethodEnum(method_upper)
-    except ValueError:
+    if method_upper not in _HTTP_METHODS:
         return None
 
     static, dynamic = _get_route_table(session)
@@ -207,11 +449,23 @@ def resolve_gateway_api(
     if hit is not None:
         return (hit[0], {}, hit[1])
 
-    # 2. Per-method dynamic route scan (only routes with path params)
-    for rx, api, mod in dynamic.get(method_upper, ()):
-        m = rx.match(path)
-        if m:
-            return (api, m.groupdict(), mod)
-    return None
-
-
+    # 2. Dynamic routes (with path params) for this method
+    routes = dynamic.get(method_upper)
+    if routes is None:
+        return None
+    with routes.hits_lock:
+        cached = routes.hits.get(path)
+        if cached is not None:
+            routes.hits.move_to_end(path)
+    if cached is not None:
+        # Fresh params dict: callers may mutate it
+        return (cached[0], dict(cached[1]), cached[2])
+    resolved = _match_dynamic(routes, path)
+    if resolved is None:
+        # Misses are not cached, so unknown paths cannot evict live entries
+        return None
+    with routes.hits_lock:
+        if len(routes.hits) >= _HIT_CACHE_MAX_SIZE:
+            routes.hits.popitem(last=False)
+        routes.hits[path] = resolved
+    return (resolved[0], dict(resolved[1]), resolved[2])
@@ -5,6 +5,7 @@ Uses psycopg (PostgreSQL), pymysql (MySQL), or trino (Trino) based on product_ty
 No driver layer: libs are installed via pip; DataSource (product_type, host, ...) is enough.
 """
 
+from collections.abc import Callable
 from typing import Any
 
 import psycopg
@@ -35,6 +36,77 @@ def _resolve_product_type(
     return pt
 
 
+def _connect_postgres(
+    datasource: Any,  # noqa: ARG001
+    host: str,
+    port: Any,
+    database: str,
+    username: str,
+    password: str,
+    timeout: int,
+) -> Any:
+    return psycopg.connect(
+        host=host,
+        port=int(port),
+        dbname=database,
+        user=username,
+        password=password,
+        connect_timeout=timeout,
+    )
+
+
+def _connect_mysql(
+    datasource: Any,  # noqa: ARG001
+    host: str,
+    port: Any,
+    database: str,
+    username: str,
+    password: str,
+    timeout: int,
+) -> Any:
+    return pymysql.connect(
+        host=host,
+        port=int(port),
+        database=database,
+        user=username,
+        password=password,
+        connect_timeout=timeout,
+    )
+
+
+def _connect_trino(
+    datasource: Any,
+    host: str,
+    port: Any,
+    database: str,
+    username: str,
+    password: str,
+    timeout: int,
+) -> Any:
+    use_ssl = _get(datasource, "use_ssl") in (True, "true", "1")
+    if use_ssl and not (password and password.strip()):
+        raise ValueError("Password is required for Trino when using SSL/HTTPS.")
+    return trino_connect(
+        host=host,
+        port=int(port),
+        user=username,
+        auth=BasicAuthentication(username, password or ""),
+        catalog=database,
+        schema="default",
+        source="pydbapi",
+        http_scheme="https" if use_ssl else "http",
+        request_timeout=timeout,
+    )
+
+
+# product_type → driver connect function (MinIO has no SQL connection).
+_CONNECTORS: dict[ProductTypeEnum, Callable[..., Any]] = {
+    ProductTypeEnum.POSTGRES: _connect_postgres,
+    ProductTypeEnum.MYSQL: _connect_mysql,
+    ProductTypeEnum.TRINO: _connect_trino,
+}
+
+
 def connect(
     datasource: Any,
     *,
@@ -66,45 +138,22 @@ def connect(
         decrypt_value(raw_password) if decrypt and raw_password else (raw_password or "")
     )
 
-    timeout = settings.EXTERNAL_DB_CONNECT_TIMEOUT
-
-    if pt == ProductTypeEnum.TRINO:
-        use_ssl = _get(datasource, "use_ssl") in (True, "true", "1")
-        if use_ssl and not (password and password.strip()):
-            raise ValueError("Password is required for Trino when using SSL/HTTPS.")
-
-    if pt == ProductTypeEnum.POSTGRES:
-        return psycopg.connect(
-            host=host,
-            port=int(port),
-            dbname=database,
-            user=username,
-            password=password,
-            connect_timeout=timeout,
-        )
-    if pt == ProductTypeEnum.MYSQL:
-        return pymysql.connect(
-            host=host,
-            port=int(port),
-            database=database,
-            user=username,
-            password=password,
-            connect_timeout=timeout,
-        )
-    if pt == ProductTypeEnum.TRINO:
-        use_ssl = _get(datasource, "use_ssl") in (True, "true", "1")
-        return trino_connect(
-            host=host,
-            port=int(port),
-            user=username,
-            auth=BasicAuthentication(username, password or ""),
-            catalog=database,
-            schema="default",
-            source="pydbapi",
-            http_scheme="https" if use_ssl else "http",
-            request_timeout=timeout,
-        )
-    raise ValueError(f"Unsupported product_type: {pt}")
+    connector = _CONNECTORS.get(pt)
+    if connector is None:
+        raise ValueError(f"Unsupported product_type: {pt}")
+    return connector(
+        datasource,
+        host,
+        port,
+        database,
+        username,
+        password,
+        settings.EXTERNAL_DB_CONNECT_TIMEOUT,
+    )
+
+
+# Session statement timeout (ms) last applied on a MySQL / Trino connection.
+_TIMEOUT_ATTR = "_pydbapi_statement_timeout_ms"
 
 
 def execute(
@@ -118,44 +167,34 @@ def execute(
     Execute SQL and return the cursor. Caller uses cursor_to_dicts(cursor) or cursor.rowcount.
 
     - product_type: used for EXTERNAL_DB_STATEMENT_TIMEOUT (Postgres: statement_timeout,
-      MySQL: max_execution_time). When set, applies timeout before the query and resets after.
-    Uses a single cursor for SET + query to minimise round-trips.
+      MySQL: max_execution_time, Trino: query_max_execution_time).
+    Postgres uses ``SET LOCAL`` (reverts at commit/rollback, so no reset). MySQL and
+    Trino session settings survive rollback, so the applied value is remembered on
+    the connection and SET is only sent when it changes (pooled reuse costs nothing).
     """
     timeout_sec = settings.EXTERNAL_DB_STATEMENT_TIMEOUT
-    apply_timeout = (
-        timeout_sec is not None and timeout_sec > 0 and product_type is not None
+    timeout_ms = (
+        int(timeout_sec * 1000) if timeout_sec is not None and timeout_sec > 0 else 0
     )
 
     cur = conn.cursor()
-    try:
-        if apply_timeout:
-            timeout_ms = int(timeout_sec * 1000)
-            if product_type == ProductTypeEnum.POSTGRES:
-                cur.execute("SET statement_timeout = %s", (str(timeout_ms),))
-            elif product_type == ProductTypeEnum.MYSQL:
+    if product_type == ProductTypeEnum.POSTGRES:
+        if timeout_ms:
+            cur.execute("SET LOCAL statement_timeout = %s", (str(timeout_ms),))
+    elif product_type in (ProductTypeEnum.MYSQL, ProductTypeEnum.TRINO):
+        if getattr(conn, _TIMEOUT_ATTR, 0) != timeout_ms:
+            if product_type == ProductTypeEnum.MYSQL:
                 cur.execute("SET SESSION max_execution_time = %s", (timeout_ms,))
-            elif product_type == ProductTypeEnum.TRINO:
+            else:
                 cur.execute(
-                    "SET SESSION query_max_execution_time = '%ss'" % int(timeout_sec)
+                    f"SET SESSION query_max_execution_time = '{timeout_ms // 1000}s'"
                 )
+            setattr(conn, _TIMEOUT_ATTR, timeout_ms)
 
-        if params is not None:
-            cur.execute(sql, params)
-        else:
-            cur.execute(sql)
-    finally:
-        if apply_timeout:
-            try:
-                cur.execute(
-                    "SET statement_timeout = 0"
-                    if product_type == ProductTypeEnum.POSTGRES
-                    else "SET SESSION max_execution_time = 0"
-                    if product_type == ProductTypeEnum.MYSQL
-                    else "SET SESSION query_max_execution_time = '0s'"  # noqa: S608
-                )
-            except Exception:
-                pass
-
+    if params is not None:
+        cur.execute(sql, params)
+    else:
+        cur.execute(sql)
     return cur
 
 
@@ -203,9 +242,13 @@ def _bool_coerce_indexes(cursor: Any) -> set[int]:
     return out
 
 
-def cursor_to_dicts(cursor: Any) -> list[dict[str, Any]]:
+def cursor_to_dicts(cursor: Any, chunk_size: int = 1000) -> list[dict[str, Any]]:
     """Convert cursor result to list of dicts.
 
+    Rows are pulled with ``fetchmany(chunk_size)`` so only one batch of raw
+    row tuples is alive next to the growing dict list, instead of a full
+    ``fetchall()`` copy of the result set.
+
     For pymysql-family drivers (MySQL, StarRocks) detects TINYINT(1) columns
     via ``cursor.description`` and coerces values to Python bool — see
     :func:`_bool_coerce_indexes`. psycopg / Trino cursors are untouched.
@@ -213,17 +256,17 @@ def cursor_to_dicts(cursor: Any) -> list[dict[str, Any]]:
     desc = cursor.description
     if not desc:
         return []
-    names = [d[0] for d in desc]
-    bool_idx = _bool_coerce_indexes(cursor)
-    if not bool_idx:
-        return [dict(zip(names, row, strict=True)) for row in cursor.fetchall()]
-
+    names = tuple(d[0] for d in desc)
+    bool_cols = [(i, names[i]) for i in _bool_coerce_indexes(cursor)]
     out: list[dict[str, Any]] = []
-    for row in cursor.fetchall():
-        d = dict(zip(names, row, strict=True))
-        for i in bool_idx:
-            v = row[i]
-            if v is not None:
-                d[names[i]] = bool(v)
-        out.append(d)
+    while rows := cursor.fetchmany(chunk_size):
+        # DB-API rows always match ``description``: skip zip's length check.
+        batch = [dict(zip(names, row, strict=False)) for row in rows]
+        # Coerce column by column so the common no-bool case costs nothing.
+        for i, name in bool_cols:
+            for d, row in zip(batch, rows, strict=False):
+                v = row[i]
+                if v is not None:
+                    d[name] = bool(v)
+        out += batch
     return out
@@ -12,6 +12,8 @@ import time
 import uuid
 from typing import Any, NamedTuple
 
+import psycopg
+
 from app.core.config import settings
 from app.models_dbapi import DataSource
 
@@ -131,7 +133,12 @@ class PoolManager:
         """Lightweight ping: attempt a no-op query to detect broken connections."""
         try:
             cur = conn.cursor()
-            cur.execute("SELECT 1")
+            if isinstance(conn, psycopg.Connection):
+                # Pinged on every checkout after idling: prepare it server-side
+                # on first use (psycopg would only auto-prepare after 5 runs).
+                cur.execute("SELECT 1", prepare=True)
+            else:
+                cur.execute("SELECT 1")
             cur.close()
             return True
         except Exception:
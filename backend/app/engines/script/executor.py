@@ -141,7 +141,7 @@ def _inject_extra_modules(g: dict[str, Any]) -> None:
             pass  # Skip missing or broken modules
 
 
-def _exec_with_timeout(code: object, g: dict[str, Any], timeout_sec: int) -> None:
+def _exec_with_timeout(code: object, g: dict[str, Any], timeout_sec: float) -> None:
     """Run exec(code, g) in a daemon thread with a timeout.
 
     Uses ctypes.pythonapi.PyThreadState_SetAsyncExc to inject
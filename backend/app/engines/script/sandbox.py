@@ -72,16 +72,10 @@ def compile_script(script: str, filename: str = "<script>") -> Any:
     return _compile_cached(script_hash, script, filename)
 
 
-def build_restricted_globals(context_dict: dict[str, Any]) -> dict[str, Any]:
-    """
-    Build the globals dict for exec(compiled, globals): safe builtins, guards,
-    extra (json, datetime), and context (db, http, cache, env, log, req, tx, ds).
-    """
+def _make_base_globals() -> dict[str, Any]:
+    """Context-independent part of the script globals (without ``__builtins__``)."""
     safe = _make_safe_builtins()
-    g: dict[str, Any] = {
-        "__builtins__": safe,
-        "__name__": "script",
-    }
+    g: dict[str, Any] = {"__name__": "script"}
     g.update(_make_guard_globals())
     g.update(_make_extra_globals())
     # Expose common builtins as top-level names for convenience.
@@ -106,5 +100,20 @@ def build_restricted_globals(context_dict: dict[str, Any]) -> dict[str, Any]:
         obj = safe.get(name, getattr(builtins, name, None))
         if obj is not None:
             g[name] = obj
+    return g
+
+
+_BASE_GLOBALS = _make_base_globals()
+
+
+def build_restricted_globals(context_dict: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build the globals dict for exec(compiled, globals): safe builtins, guards,
+    extra (json, datetime), and context (db, http, cache, env, log, req, tx, ds).
+
+    The guard/extra part is built once at import; each call gets its own
+    copy of it and of the builtins, so scripts never share a namespace.
+    """
+    g = {"__builtins__": _make_safe_builtins(), **_BASE_GLOBALS}
     g.update(context_dict)
     return g
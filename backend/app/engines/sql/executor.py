@@ -27,6 +27,11 @@ def _is_select_like(sql: str) -> bool:
     return first in ("SELECT", "WITH")
 
 
+# Characters/pairs that can start a quoted literal, a comment or a terminator
+_SPLIT_TOKEN_RE = re.compile(r"""['";]|\$\$|--|/\*""")
+_QUOTE_STOP_RE = {q: re.compile(rf"[{q}\\]") for q in ("'", '"')}
+
+
 def _split_statements(sql: str) -> list[str]:
     """Split SQL into statements on ``;`` while respecting quoted strings.
 
@@ -34,77 +39,54 @@ def _split_statements(sql: str) -> list[str]:
     dollar-quoted (``$$...$$``) literals so that semicolons inside them
     are not treated as statement terminators.
     """
+    if ";" not in sql:
+        single = sql.strip()
+        return [single] if single else []
+
     stmts: list[str] = []
-    current: list[str] = []
+    start = 0  # start of the statement being accumulated
     i = 0
     length = len(sql)
 
     while i < length:
-        ch = sql[i]
-
-        if ch in ("'", '"'):
-            quote = ch
-            current.append(ch)
-            i += 1
-            while i < length:
-                c = sql[i]
-                current.append(c)
-                if c == quote:
-                    if i + 1 < length and sql[i + 1] == quote:
-                        current.append(sql[i + 1])
-                        i += 2
+        m = _SPLIT_TOKEN_RE.search(sql, i)
+        if m is None:
+            break
+        tok = m.group()
+        i = m.end()
+
+        if tok in ("'", '"'):
+            stop = _QUOTE_STOP_RE[tok]
+            while True:
+                q = stop.search(sql, i)
+                if q is None:
+                    i = length
+                    break
+                i = q.end()
+                if q.group() == tok:
+                    if i < length and sql[i] == tok:
+                        i += 1
                         continue
-                    i += 1
                     break
-                if c == "\\" and i + 1 < length:
-                    current.append(sql[i + 1])
-                    i += 2
-                    continue
-                i += 1
-            continue
-
-        if ch == "$" and i + 1 < length and sql[i + 1] == "$":
-            tag_end = sql.find("$$", i + 2)
-            if tag_end == -1:
-                current.append(sql[i:])
-                i = length
-            else:
-                current.append(sql[i : tag_end + 2])
-                i = tag_end + 2
-            continue
-
-        if ch == "-" and i + 1 < length and sql[i + 1] == "-":
+                # Backslash escapes the next character
+                if i < length:
+                    i += 1
+        elif tok == "$$":
+            end = sql.find("$$", i)
+            i = length if end == -1 else end + 2
+        elif tok == "--":
             end = sql.find("\n", i)
-            if end == -1:
-                current.append(sql[i:])
-                i = length
-            else:
-                current.append(sql[i : end + 1])
-                i = end + 1
-            continue
-
-        if ch == "/" and i + 1 < length and sql[i + 1] == "*":
-            end = sql.find("*/", i + 2)
-            if end == -1:
-                current.append(sql[i:])
-                i = length
-            else:
-                current.append(sql[i : end + 2])
-                i = end + 2
-            continue
-
-        if ch == ";":
-            stmt = "".join(current).strip()
+            i = length if end == -1 else end + 1
+        elif tok == "/*":
+            end = sql.find("*/", i)
+            i = length if end == -1 else end + 2
+        else:
+            stmt = sql[start : m.start()].strip()
             if stmt:
                 stmts.append(stmt)
-            current = []
-            i += 1
-            continue
-
-        current.append(ch)
-        i += 1
+            start = i
 
-    tail = "".join(current).strip()
+    tail = sql[start:].strip()
     if tail:
         stmts.append(tail)
     return stmts
@@ -12,9 +12,6 @@ import re
 from datetime import date, datetime
 from typing import Any
 
-# Single-quote escape for SQL strings
-_SQL_QUOTE_ESCAPE = str.maketrans({"'": "''"})
-
 # Safe SQL identifier pattern: letters, digits, underscore, dot (for schema.table.column)
 _IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
 
@@ -49,7 +46,7 @@ def sql_string(value: Any) -> SqlSafe:
     """
     if value is None:
         return _safe("NULL")
-    s = str(value).translate(_SQL_QUOTE_ESCAPE)
+    s = str(value).replace("'", "''")
     return _safe(f"'{s}'")
 
 
@@ -113,7 +110,7 @@ def sql_datetime(value: Any) -> SqlSafe:
         return _safe("NULL")
     dt = value
     if isinstance(dt, str):
-        s = dt.translate(_SQL_QUOTE_ESCAPE)
+        s = dt.replace("'", "''")
         return _safe(f"'{s}'")
     if isinstance(dt, (datetime, date)):
         if isinstance(dt, date) and not isinstance(dt, datetime):
@@ -144,7 +141,7 @@ def in_list(value: Any) -> SqlSafe:
         elif isinstance(v, (int, float)):
             parts.append(str(v))
         else:
-            s = str(v).translate(_SQL_QUOTE_ESCAPE)
+            s = str(v).replace("'", "''")
             parts.append(f"'{s}'")
     return _safe("(" + ", ".join(parts) + ")")
 
@@ -162,7 +159,7 @@ def sql_like(value: Any) -> SqlSafe:
     """
     if value is None:
         return _safe("NULL")
-    s = str(value).translate(_SQL_QUOTE_ESCAPE)
+    s = str(value).replace("'", "''")
     return _safe(f"'{_escape_like(s)}'")
 
 
@@ -172,7 +169,7 @@ def sql_like_start(value: Any) -> SqlSafe:
     """
     if value is None:
         return _safe("NULL")
-    s = str(value).translate(_SQL_QUOTE_ESCAPE)
+    s = str(value).replace("'", "''")
     return _safe(f"'{_escape_like(s)}%'")
 
 
@@ -182,7 +179,7 @@ def sql_like_end(value: Any) -> SqlSafe:
     """
     if value is None:
         return _safe("NULL")
-    s = str(value).translate(_SQL_QUOTE_ESCAPE)
+    s = str(value).replace("'", "''")
     return _safe(f"'%{_escape_like(s)}'")
 
 
@@ -289,7 +286,7 @@ def _json_filter(value: Any) -> SqlSafe:
         s = json.dumps(value, default=str)
     except (TypeError, ValueError):
         return _safe("NULL")
-    s = s.translate(_SQL_QUOTE_ESCAPE)
+    s = s.replace("'", "''")
     return _safe(f"'{s}'")
 
 
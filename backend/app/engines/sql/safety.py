@@ -9,6 +9,9 @@ but a warning still helps API developers use the correct type-specific filter
 (e.g. ``sql_int`` for integers instead of relying on the string-based
 auto-escape default).
 
+Templates are checked by walking their Jinja2 AST; a template that does not
+parse falls back to a line-by-line scan so the editor still gets warnings.
+
 Usage::
 
     warnings = check_sql_template_safety(template_content)
@@ -18,9 +21,13 @@ Usage::
 import re
 from typing import Any
 
+from jinja2 import TemplateSyntaxError, nodes
+from jinja2.visitor import NodeVisitor
+
 from app.engines.sql.filters import SQL_FILTERS
+from app.engines.sql.template_engine import parse_sql_template
 
-_KNOWN_FILTERS = set(SQL_FILTERS.keys()) | {"int", "float", "string"}
+_KNOWN_FILTERS: frozenset[str] = frozenset(SQL_FILTERS) | {"int", "float", "string"}
 
 _VAR_PATTERN = re.compile(
     r"\{\{(?P<expr>.*?)\}\}",
@@ -41,14 +48,49 @@ def _extract_filters(expr: str) -> list[str]:
     return filters
 
 
-def check_sql_template_safety(template: str) -> list[dict[str, Any]]:
-    """Analyse a SQL Jinja2 template and return warnings for expressions
-    that don't use an explicit SQL filter.
+def _warning(var_name: str, line_no: int) -> dict[str, Any]:
+    return {
+        "variable": var_name,
+        "line": line_no,
+        "message": (
+            f"'{{{{ {var_name} }}}}' has no explicit SQL filter. "
+            f"It will be auto-escaped as a quoted string. "
+            f"Consider using a type-specific filter: "
+            f"| sql_string, | sql_int, | sql_float, | sql_datetime, etc."
+        ),
+    }
 
-    Each warning is a dict with ``variable``, ``line``, and ``message`` keys.
 
-    An empty list means no issues detected.
-    """
+class _SafetyVisitor(NodeVisitor):
+    """Collect a warning for each ``{{ }}`` output without a known SQL filter."""
+
+    def __init__(self) -> None:
+        self.warnings: list[dict[str, Any]] = []
+
+    def visit_Output(self, node: nodes.Output) -> None:
+        for child in node.nodes:
+            if isinstance(child, nodes.TemplateData):
+                continue
+            expr: nodes.Node | None = child
+            filters: list[str] = []
+            while isinstance(expr, nodes.Filter):
+                filters.append(expr.name)
+                expr = expr.node
+            if any(f in _KNOWN_FILTERS for f in filters):
+                continue
+            if expr is None:
+                continue
+            name = expr if isinstance(expr, nodes.Name) else expr.find(nodes.Name)
+            if name is None:
+                # Constant-only expressions carry no request input
+                continue
+            self.warnings.append(_warning(name.name, child.lineno))
+        # Outputs can nest (e.g. inside {% where %} / {% if %} bodies)
+        self.generic_visit(node)
+
+
+def _check_by_lines(template: str) -> list[dict[str, Any]]:
+    """Regex fallback for templates that do not parse."""
     warnings: list[dict[str, Any]] = []
     lines = template.split("\n")
 
@@ -64,17 +106,23 @@ def check_sql_template_safety(template: str) -> list[dict[str, Any]]:
                     continue
 
             var_name = expr.split("|")[0].strip().split(".")[0].split("[")[0].strip()
-            warnings.append(
-                {
-                    "variable": var_name,
-                    "line": line_no,
-                    "message": (
-                        f"'{{{{ {var_name} }}}}' has no explicit SQL filter. "
-                        f"It will be auto-escaped as a quoted string. "
-                        f"Consider using a type-specific filter: "
-                        f"| sql_string, | sql_int, | sql_float, | sql_datetime, etc."
-                    ),
-                }
-            )
+            warnings.append(_warning(var_name, line_no))
 
     return warnings
+
+
+def check_sql_template_safety(template: str) -> list[dict[str, Any]]:
+    """Analyse a SQL Jinja2 template and return warnings for expressions
+    that don't use an explicit SQL filter.
+
+    Each warning is a dict with ``variable``, ``line``, and ``message`` keys.
+
+    An empty list means no issues detected.
+    """
+    try:
+        ast = parse_sql_template(template)
+    except TemplateSyntaxError:
+        return _check_by_lines(template)
+    visitor = _SafetyVisitor()
+    visitor.visit(ast)
+    return visitor.warnings
@@ -15,15 +15,24 @@ are still finalized normally.
 
 Performance: Compiled Jinja2 ``Template`` objects are cached in an LRU
 dict keyed by template source hash so repeated calls with the same SQL
-template skip the parse phase entirely.
+template skip the parse phase entirely.  Parsed ASTs are cached the same way
+and shared by ``parse_parameters`` and ``check_sql_template_safety``.
 """
 
 import hashlib
 import threading
 from collections import OrderedDict
+from collections.abc import Callable
 
 import jinja2.runtime
-from jinja2 import Template, TemplateError, TemplateSyntaxError, UndefinedError, meta
+from jinja2 import (
+    Template,
+    TemplateError,
+    TemplateSyntaxError,
+    UndefinedError,
+    meta,
+    nodes,
+)
 from jinja2.sandbox import SandboxedEnvironment
 
 from app.core.config import settings
@@ -34,6 +43,7 @@ _SQL_ENV: SandboxedEnvironment | None = None
 
 _CACHE_MAX_SIZE = 512
 _template_cache: OrderedDict[str, Template] = OrderedDict()
+_ast_cache: OrderedDict[str, nodes.Template] = OrderedDict()
 _cache_lock = threading.Lock()
 
 # ---------------------------------------------------------------------------
@@ -74,20 +84,44 @@ def _get_sql_env() -> SandboxedEnvironment:
     return _SQL_ENV
 
 
-def _compile_cached(env: SandboxedEnvironment, source: str) -> Template:
-    """Return a compiled ``Template`` from cache or compile & cache it."""
+def _lru_get_or_build[T](
+    cache: OrderedDict[str, T], source: str, build: Callable[[str], T]
+) -> T:
+    """Return ``cache[hash(source)]``, building and inserting it on a miss."""
     key = hashlib.md5(source.encode(), usedforsecurity=False).hexdigest()
     with _cache_lock:
-        tpl = _template_cache.get(key)
-        if tpl is not None:
-            _template_cache.move_to_end(key)
-            return tpl
-    tpl = env.from_string(source)
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+            return value
+    value = build(source)
     with _cache_lock:
-        _template_cache[key] = tpl
-        if len(_template_cache) > _CACHE_MAX_SIZE:
-            _template_cache.popitem(last=False)
-    return tpl
+        cache[key] = value
+        if len(cache) > _CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+    return value
+
+
+def _compile_cached(env: SandboxedEnvironment, source: str) -> Template:
+    """Return a compiled ``Template`` from cache or compile & cache it."""
+    return _lru_get_or_build(_template_cache, source, env.from_string)
+
+
+def parse_sql_template(source: str) -> nodes.Template:
+    """Return the Jinja2 AST of *source* (cached; treat as read-only).
+
+    Shared by ``parse_parameters`` and ``check_sql_template_safety`` so a
+    template is lexed and parsed once.  ``render`` keeps its own compiled
+    ``Template`` cache because compiling constant-folds the AST in place.
+    """
+    return _lru_get_or_build(_ast_cache, source, _get_sql_env().parse)
+
+
+def clear_template_caches() -> None:
+    """Drop all cached compiled templates and ASTs."""
+    with _cache_lock:
+        _template_cache.clear()
+        _ast_cache.clear()
 
 
 class SQLTemplateEngine:
@@ -138,7 +172,4 @@ class SQLTemplateEngine:
 
     def parse_parameters(self, template: str) -> list[str]:
         """Extract variable names used in ``{{ }}`` and ``{% %}`` (undeclared)."""
-        env = _get_sql_env()
-        ast = env.parse(template)
-        names = meta.find_undeclared_variables(ast)
-        return sorted(names)
+        return sorted(meta.find_undeclared_variables(parse_sql_template(template)))
@@ -5,9 +5,11 @@ import uuid
 from fastapi.testclient import TestClient
 
 from app.core.config import settings
-from app.models_dbapi import ExecuteEngineEnum, HttpMethodEnum
-from tests.utils.api_assignment import create_random_assignment
-from tests.utils.datasource import create_random_datasource
+from app.models_dbapi import DataSource, ExecuteEngineEnum, HttpMethodEnum
+from tests.utils.api_assignment import (
+    create_random_assignment,
+    create_random_assignments,
+)
 from tests.utils.module import create_random_module
 from tests.utils.utils import random_lower_string
 
@@ -55,8 +57,13 @@ def test_list_api_assignments_with_data(
 def test_list_api_assignments_filter_is_published(
     client: TestClient, superuser_token_headers: dict[str, str], db
 ) -> None:
-    create_random_assignment(db, name="pub-a", is_published=True)
-    create_random_assignment(db, name="draft-b", is_published=False)
+    create_random_assignments(
+        db,
+        [
+            {"name": "pub-a", "is_published": True},
+            {"name": "draft-b", "is_published": False},
+        ],
+    )
     response = client.post(
         f"{_base()}/list",
         headers=superuser_token_headers,
@@ -79,14 +86,16 @@ def test_list_api_assignments_unauthorized(client: TestClient) -> None:
 
 
 def test_create_api_assignment(
-    client: TestClient, superuser_token_headers: dict[str, str], db
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db,
+    shared_datasource: DataSource,
 ) -> None:
     m = create_random_module(db, name="mod-for-api")
-    ds = create_random_datasource(db)
     unique_path = f"users-{random_lower_string()}"
     payload = {
         "module_id": str(m.id),
-        "datasource_id": str(ds.id),
+        "datasource_id": str(shared_datasource.id),
         "name": "new-api",
         "path": unique_path,
         "http_method": HttpMethodEnum.GET.value,
@@ -109,15 +118,42 @@ def test_create_api_assignment(
     assert "id" in data
 
 
+def test_create_api_assignment_duplicate_path_param_returns_400(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db,
+    shared_datasource: DataSource,
+) -> None:
+    m = create_random_module(db, name="mod-dup-param")
+    payload = {
+        "module_id": str(m.id),
+        "datasource_id": str(shared_datasource.id),
+        "name": "dup-param-api",
+        "path": f"{random_lower_string()}/{{id}}/{{id}}",
+        "http_method": HttpMethodEnum.GET.value,
+        "execute_engine": ExecuteEngineEnum.SQL.value,
+        "content": "SELECT 1",
+    }
+    response = client.post(
+        f"{_base()}/create",
+        headers=superuser_token_headers,
+        json=payload,
+    )
+    assert response.status_code == 400
+    assert "unique" in response.json()["detail"]
+
+
 def test_create_api_assignment_with_content(
-    client: TestClient, superuser_token_headers: dict[str, str], db
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db,
+    shared_datasource: DataSource,
 ) -> None:
     m = create_random_module(db, name="mod-ctx")
-    ds = create_random_datasource(db)
     unique_path = f"test-{random_lower_string()}"
     payload = {
         "module_id": str(m.id),
-        "datasource_id": str(ds.id),
+        "datasource_id": str(shared_datasource.id),
         "name": "api-with-ctx",
         "path": unique_path,
         "http_method": HttpMethodEnum.POST.value,
@@ -162,12 +198,16 @@ def test_create_api_assignment_unauthorized(client: TestClient, db) -> None:
 
 
 def test_update_api_assignment(
-    client: TestClient, superuser_token_headers: dict[str, str], db
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db,
+    shared_datasource: DataSource,
 ) -> None:
     old_path = f"old-{random_lower_string()}"
     new_path = f"new-{random_lower_string()}"
-    ds = create_random_datasource(db)
-    a = create_random_assignment(db, name="before", path=old_path, datasource_id=ds.id)
+    a = create_random_assignment(
+        db, name="before", path=old_path, datasource_id=shared_datasource.id
+    )
     response = client.post(
         f"{_base()}/update",
         headers=superuser_token_headers,
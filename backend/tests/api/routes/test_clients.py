@@ -6,7 +6,7 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.core.config import settings
-from tests.utils.client import create_random_client
+from tests.utils.client import create_random_client, create_random_clients
 
 
 def _base() -> str:
@@ -53,8 +53,13 @@ def test_list_clients_with_data(
 def test_list_clients_filter_is_active(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
-    create_random_client(db, name="active-cli", is_active=True)
-    create_random_client(db, name="inactive-cli", is_active=False)
+    create_random_clients(
+        db,
+        [
+            {"name": "active-cli", "is_active": True},
+            {"name": "inactive-cli", "is_active": False},
+        ],
+    )
     response = client.post(
         f"{_base()}/list",
         headers=superuser_token_headers,
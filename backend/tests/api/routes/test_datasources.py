@@ -6,7 +6,7 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.core.config import settings
-from app.models_dbapi import ProductTypeEnum
+from app.models_dbapi import DataSource, ProductTypeEnum
 from tests.utils.datasource import create_random_datasource
 
 
@@ -235,12 +235,13 @@ def test_delete_datasource_not_found(
 
 
 def test_test_datasource_ok(
-    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    shared_datasource: DataSource,
 ) -> None:
     """Uses app Postgres; passes when Postgres is reachable (e.g. CI with docker)."""
-    ds = create_random_datasource(db)
     response = client.get(
-        f"{_base()}/test/{ds.id}",
+        f"{_base()}/test/{shared_datasource.id}",
         headers=superuser_token_headers,
     )
     assert response.status_code == 200
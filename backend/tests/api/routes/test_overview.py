@@ -1,12 +1,14 @@
 """Tests for Overview / Dashboard API (Phase 2, Task 2.7)."""
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.core.config import settings
-from tests.utils.api_assignment import create_random_assignment
-from tests.utils.client import create_random_client
-from tests.utils.datasource import create_random_datasource
+from tests.utils.api_assignment import (
+    create_random_assignment,
+    create_random_assignments,
+)
 from tests.utils.group import create_random_group
 from tests.utils.module import create_random_module
 from tests.utils.overview import (
@@ -45,16 +47,14 @@ def test_get_overview_stats_structure(
         assert data[k] >= 0, f"{k} should be >= 0"
 
 
+@pytest.mark.usefixtures("shared_datasource", "shared_client")
 def test_get_overview_stats_with_data(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
     """With created entities, stats reflect at least those counts."""
-    create_random_datasource(db)
     create_random_module(db)
     create_random_group(db)
-    create_random_assignment(db, is_published=True)
-    create_random_assignment(db, is_published=False)
-    create_random_client(db)
+    create_random_assignments(db, [{"is_published": True}, {"is_published": False}])
 
     response = client.get(f"{_base()}/stats", headers=superuser_token_headers)
     assert response.status_code == 200
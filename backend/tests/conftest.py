@@ -20,6 +20,8 @@ from app.models_dbapi import (
     MacroDefVersionCommit,
 )
 from app.models_permission import Role, RolePermissionLink, UserRoleLink
+from tests.utils.client import create_random_client
+from tests.utils.datasource import create_random_datasource
 from tests.utils.user import authentication_token_from_username
 from tests.utils.utils import get_superuser_token_headers
 
@@ -54,6 +56,18 @@ def db() -> Generator[Session, None, None]:
         session.commit()
 
 
+@pytest.fixture(scope="session")
+def shared_datasource(db: Session) -> DataSource:
+    """One DataSource for tests that only need *a* datasource; do not mutate."""
+    return create_random_datasource(db)
+
+
+@pytest.fixture(scope="session")
+def shared_client(db: Session) -> AppClient:
+    """One AppClient for tests that only need *a* client; do not mutate."""
+    return create_random_client(db)
+
+
 @pytest.fixture(scope="module")
 def client() -> Generator[TestClient, None, None]:
     with TestClient(app) as c:
@@ -10,12 +10,12 @@ from app.core.security import (
     TOKEN_TYPE_GATEWAY,
     create_access_token,
 )
-from tests.utils.client import create_random_client
+from app.models_dbapi import AppClient
 
 
-def test_verify_gateway_client_bearer(db: Session) -> None:
+def test_verify_gateway_client_bearer(db: Session, shared_client: AppClient) -> None:
     """Bearer JWT with sub=client_id returns AppClient."""
-    c = create_random_client(db, name="bearer-test")
+    c = shared_client
     token = create_access_token(
         subject=c.client_id,
         expires_delta=timedelta(seconds=3600),
@@ -27,9 +27,9 @@ def test_verify_gateway_client_bearer(db: Session) -> None:
     assert out.id == c.id
 
 
-def test_verify_gateway_client_raw_token(db: Session) -> None:
+def test_verify_gateway_client_raw_token(db: Session, shared_client: AppClient) -> None:
     """Authorization: <token> (raw token, no Bearer) works for legacy migration."""
-    c = create_random_client(db, name="raw-token-test")
+    c = shared_client
     token = create_access_token(
         subject=c.client_id,
         expires_delta=timedelta(seconds=3600),
@@ -41,9 +41,11 @@ def test_verify_gateway_client_raw_token(db: Session) -> None:
     assert out.id == c.id
 
 
-def test_verify_gateway_client_rejects_dashboard_token(db: Session) -> None:
+def test_verify_gateway_client_rejects_dashboard_token(
+    db: Session, shared_client: AppClient
+) -> None:
     """Dashboard tokens must not be accepted as gateway tokens."""
-    c = create_random_client(db, name="cross-use-test")
+    c = shared_client
     token = create_access_token(
         subject=c.client_id,
         expires_delta=timedelta(seconds=3600),
@@ -1,6 +1,6 @@
 """Unit tests for gateway rate limiting: check_rate_limit (Phase 4, Task 4.2c)."""
 
-from unittest.mock import patch
+from dataclasses import dataclass
 
 import pytest
 
@@ -8,74 +8,84 @@ from app.core.gateway import ratelimit
 from app.core.gateway.ratelimit import check_rate_limit
 
 
+@dataclass
+class FakeSettings:
+    """Stand-in for the settings fields read by ratelimit."""
+
+    FLOW_CONTROL_RATE_LIMIT_ENABLED: bool = True
+
+
 @pytest.fixture(autouse=True)
-def _force_memory_backend() -> None:
-    """Use in-memory backend so tests don't require Redis."""
-    with patch.object(ratelimit, "get_redis", return_value=None):
-        yield
+def fake_settings(monkeypatch: pytest.MonkeyPatch) -> FakeSettings:
+    """Bind a plain settings object and the in-memory backend (no Redis needed)."""
+    s = FakeSettings()
+    monkeypatch.setattr(ratelimit, "settings", s)
+    monkeypatch.setattr(ratelimit, "get_redis", lambda **_: None)
+    return s
+
+
+@pytest.fixture
+def key_prefix(request: pytest.FixtureRequest) -> str:
+    """Per-test key namespace so tests never share in-memory counters."""
+    return request.node.nodeid
 
 
-def test_rate_limit_disabled() -> None:
+def test_rate_limit_disabled(fake_settings: FakeSettings, key_prefix: str) -> None:
     """When FLOW_CONTROL_RATE_LIMIT_ENABLED is False, all requests are allowed (kill switch)."""
-    ratelimit._memory.clear()
-    with patch("app.core.gateway.ratelimit.settings") as m:
-        m.FLOW_CONTROL_RATE_LIMIT_ENABLED = False
-        for _ in range(100):
-            assert check_rate_limit("rl_disabled", limit=1) is True
+    fake_settings.FLOW_CONTROL_RATE_LIMIT_ENABLED = False
+    for _ in range(100):
+        assert check_rate_limit(f"{key_prefix}:rl_disabled", limit=1) is True
 
 
-def test_rate_limit_no_limit_allowed() -> None:
+def test_rate_limit_no_limit_allowed(key_prefix: str) -> None:
     """When limit is None, all requests are allowed."""
-    with patch("app.core.gateway.ratelimit.settings") as m:
-        m.FLOW_CONTROL_RATE_LIMIT_ENABLED = True
-        for _ in range(100):
-            assert check_rate_limit("rl_no_limit", limit=None) is True
+    for _ in range(100):
+        assert check_rate_limit(f"{key_prefix}:rl_no_limit", limit=None) is True
 
 
-def test_rate_limit_under_limit() -> None:
+def test_rate_limit_under_limit(key_prefix: str) -> None:
     """Under the limit, all requests are allowed."""
-    with patch("app.core.gateway.ratelimit.settings") as m:
-        m.FLOW_CONTROL_RATE_LIMIT_ENABLED = True
-        for _ in range(10):
-            assert check_rate_limit("rl_under", limit=60) is True
+    for _ in range(10):
+        assert check_rate_limit(f"{key_prefix}:rl_under", limit=60) is True
 
 
-def test_rate_limit_over_limit() -> None:
+def test_rate_limit_over_limit(key_prefix: str) -> None:
     """Over the limit (61st when limit is 60), check_rate_limit returns False."""
-    ratelimit._memory.clear()
-    with patch("app.core.gateway.ratelimit.settings") as m:
-        m.FLOW_CONTROL_RATE_LIMIT_ENABLED = True
-        for _ in range(60):
-            assert check_rate_limit("rl_over", limit=60) is True
-        assert check_rate_limit("rl_over", limit=60) is False
-        assert check_rate_limit("rl_over", limit=60) is False
+    for _ in range(60):
+        assert check_rate_limit(f"{key_prefix}:rl_over", limit=60) is True
+    assert check_rate_limit(f"{key_prefix}:rl_over", limit=60) is False
+    assert check_rate_limit(f"{key_prefix}:rl_over", limit=60) is False
 
 
-def test_rate_limit_custom_limit() -> None:
+def test_rate_limit_custom_limit(key_prefix: str) -> None:
     """With limit 2, 3rd request is denied."""
-    ratelimit._memory.clear()
-    with patch("app.core.gateway.ratelimit.settings") as m:
-        m.FLOW_CONTROL_RATE_LIMIT_ENABLED = True
-        assert check_rate_limit("rl_custom", limit=2) is True
-        assert check_rate_limit("rl_custom", limit=2) is True
-        assert check_rate_limit("rl_custom", limit=2) is False
+    assert check_rate_limit(f"{key_prefix}:rl_custom", limit=2) is True
+    assert check_rate_limit(f"{key_prefix}:rl_custom", limit=2) is True
+    assert check_rate_limit(f"{key_prefix}:rl_custom", limit=2) is False
 
 
 def test_rate_limit_empty_key_allowed() -> None:
     """Empty or invalid key is allowed (fail-open)."""
-    with patch("app.core.gateway.ratelimit.settings") as m:
-        m.FLOW_CONTROL_RATE_LIMIT_ENABLED = True
-        assert check_rate_limit("", limit=60) is True
+    assert check_rate_limit("", limit=60) is True
 
 
-def test_rate_limit_per_key() -> None:
+def test_rate_limit_per_key(key_prefix: str) -> None:
     """Limits are per key; one key over limit does not affect another."""
-    ratelimit._memory.clear()
-    with patch("app.core.gateway.ratelimit.settings") as m:
-        m.FLOW_CONTROL_RATE_LIMIT_ENABLED = True
-        assert check_rate_limit("rl_a", limit=2) is True
-        assert check_rate_limit("rl_a", limit=2) is True
-        assert check_rate_limit("rl_a", limit=2) is False
-        assert check_rate_limit("rl_b", limit=2) is True
-        assert check_rate_limit("rl_b", limit=2) is True
-        assert check_rate_limit("rl_b", limit=2) is False
+    assert check_rate_limit(f"{key_prefix}:rl_a", limit=2) is True
+    assert check_rate_limit(f"{key_prefix}:rl_a", limit=2) is True
+    assert check_rate_limit(f"{key_prefix}:rl_a", limit=2) is False
+    assert check_rate_limit(f"{key_prefix}:rl_b", limit=2) is True
+    assert check_rate_limit(f"{key_prefix}:rl_b", limit=2) is True
+    assert check_rate_limit(f"{key_prefix}:rl_b", limit=2) is False
+
+
+def test_rate_limit_window_expires(
+    monkeypatch: pytest.MonkeyPatch, key_prefix: str
+) -> None:
+    """Timestamps older than the 60s window no longer count toward the limit."""
+    t0 = 10**12
+    monkeypatch.setattr(ratelimit.time, "monotonic_ns", lambda: t0)
+    assert check_rate_limit(f"{key_prefix}:rl_expire", limit=1) is True
+    assert check_rate_limit(f"{key_prefix}:rl_expire", limit=1) is False
+    monkeypatch.setattr(ratelimit.time, "monotonic_ns", lambda: t0 + 60 * 10**9 + 1)
+    assert check_rate_limit(f"{key_prefix}:rl_expire", limit=1) is True
@@ -1,10 +1,15 @@
 """Unit tests for gateway request/response: parse_params, merge_params, keys_to_snake, keys_to_camel, format_response (Phase 4, Task 4.3)."""
 
 import asyncio
+import json
+from collections.abc import Callable
+from decimal import Decimal
 
+import pytest
 from starlette.requests import Request
 
 from app.core.gateway.request_response import (
+    GatewayJSONResponse,
     format_response,
     keys_to_camel,
     keys_to_snake,
@@ -66,35 +71,68 @@ def test_keys_to_camel_row_count_key() -> None:
     assert keys_to_camel({"row_count": 5}) == {"rowCount": 5}
 
 
+def test_keys_to_snake_already_snake_returns_same_object() -> None:
+    obj = {"id": 1, "user": {"first_name": "a"}, "items": [{"item_id": 1}]}
+    assert keys_to_snake(obj) is obj
+
+
+def test_keys_to_camel_no_underscores_returns_same_object() -> None:
+    obj = [{"id": 1, "user": {"first": "a"}, "tags": ["x"]}]
+    assert keys_to_camel(obj) is obj
+
+
+def test_keys_to_snake_partial_conversion_keeps_order_and_input() -> None:
+    obj = {"id": 1, "userId": 2, "meta": {"ok": True}}
+    out = keys_to_snake(obj)
+    assert list(out) == ["id", "user_id", "meta"]
+    assert out["meta"] is obj["meta"]
+    assert obj == {"id": 1, "userId": 2, "meta": {"ok": True}}
+
+
 # --- parse_params: build Request helpers ---
 
 
-def _make_request(
-    *,
-    method: str = "GET",
-    query_string: bytes = b"",
-    headers: list[tuple[bytes, bytes]] | None = None,
-    body: bytes = b"",
-) -> Request:
-    scope: dict = {
-        "type": "http",
-        "method": method,
-        "path": "/",
-        "query_string": query_string,
-        "headers": headers or [],
-        "server": ("localhost", 80),
-        "client": ("127.0.0.1", 0),
-        "scheme": "http",
-        "root_path": "",
-    }
+# Static part of the ASGI scope shared by every request built in this module.
+_BASE_SCOPE: dict = {
+    "type": "http",
+    "method": "GET",
+    "path": "/",
+    "query_string": b"",
+    "headers": [],
+    "server": ("localhost", 80),
+    "client": ("127.0.0.1", 0),
+    "scheme": "http",
+    "root_path": "",
+}
+
+
+async def _send(_: object) -> None:
+    pass
+
+
+@pytest.fixture
+def make_request() -> Callable[..., Request]:
+    """Factory building a Starlette Request from ``_BASE_SCOPE`` plus overrides."""
 
-    async def receive() -> dict:
-        return {"type": "http.request", "body": body, "more_body": False}
+    def _make(
+        *,
+        method: str = "GET",
+        query_string: bytes = b"",
+        headers: list[tuple[bytes, bytes]] | None = None,
+        body: bytes = b"",
+    ) -> Request:
+        scope = _BASE_SCOPE | {
+            "method": method,
+            "query_string": query_string,
+            "headers": headers or [],
+        }
 
-    async def send(_: object) -> None:
-        pass
+        async def receive() -> dict:
+            return {"type": "http.request", "body": body, "more_body": False}
 
-    return Request(scope, receive, send)
+        return Request(scope, receive, _send)
+
+    return _make
 
 
 def _run(coro) -> object:
@@ -104,18 +142,18 @@ def _run(coro) -> object:
 # --- parse_params ---
 
 
-def test_parse_params_path_only() -> None:
+def test_parse_params_path_only(make_request: Callable[..., Request]) -> None:
     async def run() -> dict:
-        req = _make_request()
+        req = make_request()
         params, _ = await parse_params(req, {"id": "123"}, "GET")
         return params
 
     assert _run(run()) == {"id": "123"}
 
 
-def test_parse_params_path_and_query() -> None:
+def test_parse_params_path_and_query(make_request: Callable[..., Request]) -> None:
     async def run() -> dict:
-        req = _make_request(query_string=b"a=1&b=2")
+        req = make_request(query_string=b"a=1&b=2")
         params, _ = await parse_params(req, {"id": "123"}, "GET")
         return params
 
@@ -125,10 +163,12 @@ def test_parse_params_path_and_query() -> None:
     assert out["b"] == "2"
 
 
-def test_parse_params_merge_order_path_wins() -> None:
+def test_parse_params_merge_order_path_wins(
+    make_request: Callable[..., Request],
+) -> None:
     async def run() -> dict:
         # body has a,b; query has b,c; path has c,d. path > query > body.
-        req = _make_request(
+        req = make_request(
             method="POST",
             query_string=b"b=q&c=q",
             headers=[(b"content-type", b"application/json")],
@@ -144,9 +184,9 @@ def test_parse_params_merge_order_path_wins() -> None:
     assert out["d"] == "p"
 
 
-def test_parse_params_json_body() -> None:
+def test_parse_params_json_body(make_request: Callable[..., Request]) -> None:
     async def run() -> dict:
-        req = _make_request(
+        req = make_request(
             method="POST",
             headers=[(b"content-type", b"application/json")],
             body=b'{"x": 1, "y": [2, 3]}',
@@ -158,9 +198,24 @@ def test_parse_params_json_body() -> None:
     assert out == {"x": 1, "y": [2, 3]}
 
 
-def test_parse_params_form_body() -> None:
+def test_parse_params_json_body_content_type_case_and_params(
+    make_request: Callable[..., Request],
+) -> None:
+    async def run() -> dict:
+        req = make_request(
+            method="POST",
+            headers=[(b"content-type", b"Application/JSON; charset=utf-8")],
+            body=b'{"x": 1}',
+        )
+        params, _ = await parse_params(req, {}, "POST")
+        return params
+
+    assert _run(run()) == {"x": 1}
+
+
+def test_parse_params_form_body(make_request: Callable[..., Request]) -> None:
     async def run() -> dict:
-        req = _make_request(
+        req = make_request(
             method="POST",
             headers=[(b"content-type", b"application/x-www-form-urlencoded")],
             body=b"k1=v1&k2=v2",
@@ -173,9 +228,28 @@ def test_parse_params_form_body() -> None:
     assert out["k2"] == "v2"
 
 
-def test_parse_params_naming_camel_converts_body_and_query() -> None:
+def test_parse_params_form_body_decodes_and_keeps_blank_values(
+    make_request: Callable[..., Request],
+) -> None:
     async def run() -> dict:
-        req = _make_request(
+        req = make_request(
+            method="POST",
+            headers=[
+                (b"content-type", b"application/x-www-form-urlencoded; charset=utf-8")
+            ],
+            body=b"name=J%C3%B6rg+M&empty=&k=1&k=2",
+        )
+        params, _ = await parse_params(req, {}, "POST")
+        return params
+
+    assert _run(run()) == {"name": "Jörg M", "empty": "", "k": "2"}
+
+
+def test_parse_params_naming_camel_converts_body_and_query(
+    make_request: Callable[..., Request],
+) -> None:
+    async def run() -> dict:
+        req = make_request(
             method="POST",
             query_string=b"naming=camel&someKey=qv",
             headers=[(b"content-type", b"application/json")],
@@ -192,18 +266,22 @@ def test_parse_params_naming_camel_converts_body_and_query() -> None:
     assert out.get("naming") == "camel"
 
 
-def test_parse_params_no_body_returns_empty_body() -> None:
+def test_parse_params_no_body_returns_empty_body(
+    make_request: Callable[..., Request],
+) -> None:
     async def run() -> dict:
-        req = _make_request(method="GET", headers=[])
+        req = make_request(method="GET", headers=[])
         params, _ = await parse_params(req, {}, "GET")
         return params
 
     assert _run(run()) == {}
 
 
-def test_parse_params_unknown_content_type_body_empty() -> None:
+def test_parse_params_unknown_content_type_body_empty(
+    make_request: Callable[..., Request],
+) -> None:
     async def run() -> tuple[dict, str | None]:
-        req = _make_request(
+        req = make_request(
             method="POST",
             headers=[(b"content-type", b"text/plain")],
             body=b"raw",
@@ -215,11 +293,13 @@ def test_parse_params_unknown_content_type_body_empty() -> None:
     assert body_for_log is None
 
 
-def test_parse_params_body_for_log_returned() -> None:
+def test_parse_params_body_for_log_returned(
+    make_request: Callable[..., Request],
+) -> None:
     """When body is present, body_for_log is JSON string; when empty, None."""
 
     async def run_json() -> tuple[dict, str | None]:
-        req = _make_request(
+        req = make_request(
             method="POST",
             headers=[(b"content-type", b"application/json")],
             body=b'{"a": 1}',
@@ -231,7 +311,7 @@ def test_parse_params_body_for_log_returned() -> None:
     assert body_for_log == '{"a": 1}'
 
     async def run_no_body() -> tuple[dict, str | None]:
-        req = _make_request(method="GET")
+        req = make_request(method="GET")
         return await parse_params(req, {"x": "y"}, "GET")
 
     params2, body_for_log2 = _run(run_no_body())
@@ -239,9 +319,35 @@ def test_parse_params_body_for_log_returned() -> None:
     assert body_for_log2 is None
 
 
-def test_parse_params_respects_location_header_only() -> None:
+def test_parse_params_body_for_log_is_raw_json_text(
+    make_request: Callable[..., Request],
+) -> None:
+    """body_for_log keeps the client's original JSON (spacing, camelCase keys)."""
+
+    async def run() -> tuple[dict, str | None]:
+        req = make_request(
+            method="POST",
+            query_string=b"naming=camel",
+            headers=[(b"content-type", b"application/json")],
+            body=b'{"userId":1,  "name":"J\xc3\xb6rg"}',
+        )
+        return await parse_params(req, {}, "POST")
+
+    params, body_for_log = _run(run())
+    assert params == {"user_id": 1, "name": "Jörg"}
+    assert body_for_log == '{"userId":1,  "name":"Jörg"}'
+
+
+def test_merge_params_body_for_log_serializes_without_body_text() -> None:
+    _, body_for_log = merge_params({}, {"a": 1}, {}, {}, "POST")
+    assert body_for_log == '{"a": 1}'
+
+
+def test_parse_params_respects_location_header_only(
+    make_request: Callable[..., Request],
+) -> None:
     async def run() -> dict:
-        req = _make_request(
+        req = make_request(
             method="POST",
             query_string=b"col1=query",
             headers=[(b"content-type", b"application/json"), (b"col1", b"header")],
@@ -259,9 +365,11 @@ def test_parse_params_respects_location_header_only() -> None:
     assert out == {"col1": "header"}
 
 
-def test_parse_params_wrong_location_is_ignored() -> None:
+def test_parse_params_wrong_location_is_ignored(
+    make_request: Callable[..., Request],
+) -> None:
     async def run() -> dict:
-        req = _make_request(
+        req = make_request(
             method="GET",
             query_string=b"col1=query",
             headers=[],
@@ -279,9 +387,11 @@ def test_parse_params_wrong_location_is_ignored() -> None:
     assert out == {}
 
 
-def test_parse_params_respects_location_body_only() -> None:
+def test_parse_params_respects_location_body_only(
+    make_request: Callable[..., Request],
+) -> None:
     async def run() -> dict:
-        req = _make_request(
+        req = make_request(
             method="POST",
             query_string=b"col1=query",
             headers=[(b"content-type", b"application/json")],
@@ -374,6 +484,28 @@ def test_format_response_snake_default() -> None:
     }
 
 
+def test_format_response_snake_already_safe_returns_same_object() -> None:
+    """Snake naming with JSON-safe values: no copy of envelope or rows."""
+    result = {"success": True, "message": None, "data": [{"user_id": 1}]}
+    assert format_response(result, "snake") is result
+
+
+def test_format_response_snake_converts_without_mutating_input() -> None:
+    result = {
+        "success": True,
+        "message": None,
+        "data": [{"id": 1}, {"amount": Decimal("1.5")}],
+    }
+    out = format_response(result, "snake")
+    assert out == {
+        "success": True,
+        "message": None,
+        "data": [{"id": 1}, {"amount": 1.5}],
+    }
+    assert out["data"][0] is result["data"][0]
+    assert result["data"][1]["amount"] == Decimal("1.5")
+
+
 def test_format_response_camel() -> None:
     result = {
         "success": True,
@@ -388,6 +520,18 @@ def test_format_response_camel() -> None:
     }
 
 
+def test_format_response_camel_keys_unchanged_reuses_rows() -> None:
+    row = {"id": 1, "name": "x"}
+    result = {"success": True, "message": None, "data": [row, {"total": Decimal("2")}]}
+    out = format_response(result, "camel")
+    assert out == {
+        "success": True,
+        "message": None,
+        "data": [{"id": 1, "name": "x"}, {"total": 2}],
+    }
+    assert out["data"][0] is row
+
+
 def test_format_response_camel_row_count() -> None:
     result = {"row_count": 5}
     assert format_response(result, "camel") == {"rowCount": 5}
@@ -428,3 +572,52 @@ def test_merge_params_header_location() -> None:
         params_definition=[{"name": "col1", "location": "header"}],
     )
     assert params == {"col1": "header"}
+
+
+def test_merge_params_header_location_case_insensitive() -> None:
+    params, _ = merge_params(
+        {},
+        {},
+        {},
+        {"x-tenant-id": "t1"},
+        "GET",
+        params_definition=[{"name": " X-Tenant-Id ", "location": "Header"}],
+    )
+    assert params == {"X-Tenant-Id": "t1"}
+
+
+def test_merge_params_reuses_definition_across_calls() -> None:
+    """Same params_definition object (as served from config cache) is indexed once."""
+    definition = [
+        {"name": "a", "location": "query"},
+        {"name": "b", "location": "body"},
+        {"name": "c"},
+        {"name": ""},
+        "bogus",
+    ]
+    for q in ("1", "2"):
+        params, _ = merge_params(
+            {"a": q, "b": "q", "c": "q"}, {"b": "body"}, {}, {}, "POST", definition
+        )
+        assert params == {"a": q, "b": "body", "c": "q"}
+
+
+# --- GatewayJSONResponse ---
+
+
+def test_gateway_json_response_renders_compact_utf8() -> None:
+    resp = GatewayJSONResponse(
+        content={"success": True, "message": "héllo", "data": [{"id": 1}]}
+    )
+    assert json.loads(resp.body) == {
+        "success": True,
+        "message": "héllo",
+        "data": [{"id": 1}],
+    }
+    assert resp.headers["content-type"] == "application/json"
+
+
+def test_gateway_json_response_falls_back_for_big_ints() -> None:
+    """orjson rejects ints wider than 64 bits; stdlib json handles them."""
+    resp = GatewayJSONResponse(content={"data": [2**70]})
+    assert json.loads(resp.body) == {"data": [2**70]}
@@ -1,16 +1,24 @@
 """Unit tests for gateway resolver: path_to_regex, resolve_gateway_api (Phase 4, Task 4.1)."""
 
+import uuid
+
 import pytest
 from sqlmodel import Session
 
+from app.core.gateway import resolver
 from app.core.gateway.resolver import (
     invalidate_route_cache,
     path_to_regex,
     resolve_gateway_api,
 )
-from app.models_dbapi import HttpMethodEnum
+from app.models_dbapi import (
+    ApiAssignment,
+    ApiModule,
+    DataSource,
+    ExecuteEngineEnum,
+    HttpMethodEnum,
+)
 from tests.utils.api_assignment import create_random_assignment
-from tests.utils.datasource import create_random_datasource
 from tests.utils.module import create_random_module
 from tests.utils.utils import random_lower_string
 
@@ -29,6 +37,7 @@ def test_path_to_regex_static() -> None:
     assert r.match("list").groupdict() == {}
     assert r.match("other") is None
     assert r.match("list/") is None
+    assert r.match("list\n") is None
 
 
 def test_path_to_regex_one_param() -> None:
@@ -53,20 +62,36 @@ def test_path_to_regex_special_chars_static() -> None:
     assert r.match("v10/report") is None
 
 
+def test_path_to_regex_is_cached() -> None:
+    pattern = f"cached-{random_lower_string()}/{{id}}"
+    before = path_to_regex.cache_info()
+    r1 = path_to_regex(pattern)
+    r2 = path_to_regex(pattern)
+    after = path_to_regex.cache_info()
+    assert r1 is r2
+    assert after.misses == before.misses + 1
+    assert after.hits == before.hits + 1
+
+
+def test_path_to_regex_non_identifier_placeholder_is_literal() -> None:
+    r = path_to_regex("files/{1bad}")
+    assert r.match("files/{1bad}") is not None
+    assert r.match("files/x") is None
+
+
 # --- resolve_gateway_api: the main resolver (module not in URL) ---
 
 
-def test_resolve_gateway_api_simple(db: Session) -> None:
+def test_resolve_gateway_api_simple(db: Session, shared_datasource: DataSource) -> None:
     """api.path='<unique>' -> resolve '<unique>'. Module prefix is irrelevant to URL."""
     unique_path = f"ping-{random_lower_string()}"
     mod = create_random_module(db, is_active=True)
-    ds = create_random_datasource(db)
     a = create_random_assignment(
         db,
         module_id=mod.id,
         path=unique_path,
         http_method=HttpMethodEnum.GET,
-        datasource_id=ds.id,
+        datasource_id=shared_datasource.id,
         is_published=True,
         content="SELECT 1 as x",
     )
@@ -78,18 +103,19 @@ def test_resolve_gateway_api_simple(db: Session) -> None:
     assert params == {}
 
 
-def test_resolve_gateway_api_nested_path(db: Session) -> None:
+def test_resolve_gateway_api_nested_path(
+    db: Session, shared_datasource: DataSource
+) -> None:
     """api.path='<unique>/list' -> resolve correctly. Module prefix NOT in URL."""
     seg = random_lower_string()
     nested_path = f"{seg}/list"
     mod = create_random_module(db, is_active=True)
-    ds = create_random_datasource(db)
     a = create_random_assignment(
         db,
         module_id=mod.id,
         path=nested_path,
         http_method=HttpMethodEnum.GET,
-        datasource_id=ds.id,
+        datasource_id=shared_datasource.id,
         is_published=True,
         content="SELECT 1",
     )
@@ -101,18 +127,19 @@ def test_resolve_gateway_api_nested_path(db: Session) -> None:
     assert params == {}
 
 
-def test_resolve_gateway_api_with_path_params(db: Session) -> None:
+def test_resolve_gateway_api_with_path_params(
+    db: Session, shared_datasource: DataSource
+) -> None:
     """api.path='<unique>/{id}' -> resolve '<unique>/abc'."""
     seg = random_lower_string()
     param_path = f"{seg}/{{id}}"
     mod = create_random_module(db, is_active=True)
-    ds = create_random_datasource(db)
     a = create_random_assignment(
         db,
         module_id=mod.id,
         path=param_path,
         http_method=HttpMethodEnum.GET,
-        datasource_id=ds.id,
+        datasource_id=shared_datasource.id,
         is_published=True,
         content="SELECT 1",
     )
@@ -130,18 +157,179 @@ def test_resolve_gateway_api_not_found(db: Session) -> None:
     )
 
 
-def test_resolve_gateway_api_inactive_module(db: Session) -> None:
+def test_resolve_gateway_api_inactive_module(
+    db: Session, shared_datasource: DataSource
+) -> None:
     """Inactive module -> not resolved even if api.path matches."""
     unique_path = f"hidden-ping-{random_lower_string()}"
     mod = create_random_module(db, is_active=False)
-    ds = create_random_datasource(db)
     create_random_assignment(
         db,
         module_id=mod.id,
         path=unique_path,
         http_method=HttpMethodEnum.GET,
-        datasource_id=ds.id,
+        datasource_id=shared_datasource.id,
         is_published=True,
         content="SELECT 1",
     )
     assert resolve_gateway_api(unique_path, "GET", db) is None
+
+
+# --- route table without a database (rows given in priority order) ---
+
+
+class _FakeResult:
+    def __init__(self, rows: list) -> None:
+        self._rows = rows
+
+    def all(self) -> list:
+        return self._rows
+
+
+class _FakeSession:
+    """Just enough of Session for _build_route_table."""
+
+    def __init__(self, rows: list) -> None:
+        self._rows = rows
+
+    def exec(self, _stmt: object) -> _FakeResult:
+        return _FakeResult(self._rows)
+
+    def expunge(self, _obj: object) -> None:
+        pass
+
+
+def _routes(
+    monkeypatch: pytest.MonkeyPatch, *specs: tuple[str, HttpMethodEnum]
+) -> list[ApiAssignment]:
+    """Install a route table built from (path, method) specs; first spec wins ties."""
+    mod = ApiModule(name="m")
+    apis = [
+        ApiAssignment(
+            module_id=mod.id,
+            name=f"api{i}",
+            path=path,
+            http_method=method,
+            execute_engine=ExecuteEngineEnum.SQL,
+            id=uuid.uuid4(),
+        )
+        for i, (path, method) in enumerate(specs)
+    ]
+    table = resolver._build_route_table(_FakeSession([(a, mod) for a in apis]))
+    monkeypatch.setattr(resolver, "_get_route_table", lambda _session: table)
+    return apis
+
+
+def test_resolve_dynamic_routes_follow_priority(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    a_param, a_static_tail, a_embedded = _routes(
+        monkeypatch,
+        ("items/{id}/detail", HttpMethodEnum.GET),
+        ("{kind}/7/detail", HttpMethodEnum.GET),
+        ("items/{id}.json", HttpMethodEnum.GET),
+    )
+    api, params, _ = resolve_gateway_api("items/7/detail", "GET", None)  # type: ignore[arg-type]
+    assert api is a_param
+    assert params == {"id": "7"}
+
+    api, params, _ = resolve_gateway_api("orders/7/detail", "GET", None)  # type: ignore[arg-type]
+    assert api is a_static_tail
+    assert params == {"kind": "orders"}
+
+    api, params, _ = resolve_gateway_api("items/42.json", "GET", None)  # type: ignore[arg-type]
+    assert api is a_embedded
+    assert params == {"id": "42"}
+
+
+def test_resolve_embedded_param_route_wins_when_higher_priority(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    a_embedded, _ = _routes(
+        monkeypatch,
+        ("files/v{ver}", HttpMethodEnum.GET),
+        ("files/{name}", HttpMethodEnum.GET),
+    )
+    api, params, _ = resolve_gateway_api("files/v2", "GET", None)  # type: ignore[arg-type]
+    assert api is a_embedded
+    assert params == {"ver": "2"}
+
+
+def test_resolve_dynamic_routes_method_and_empty_segment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (a_post,) = _routes(monkeypatch, ("users/{id}", HttpMethodEnum.POST))
+    assert resolve_gateway_api("users/1", "GET", None) is None  # type: ignore[arg-type]
+    assert resolve_gateway_api("users//", "POST", None) is None  # type: ignore[arg-type]
+    resolved = resolve_gateway_api("users/1", "post", None)  # type: ignore[arg-type]
+    assert resolved is not None
+    assert resolved[0] is a_post
+
+
+def test_resolve_dynamic_hits_are_memoised(monkeypatch: pytest.MonkeyPatch) -> None:
+    (a_user,) = _routes(monkeypatch, ("users/{id}", HttpMethodEnum.GET))
+    first = resolve_gateway_api("users/5", "GET", None)  # type: ignore[arg-type]
+    assert first is not None
+    first[1]["id"] = "mutated"
+    routes = resolver._get_route_table(None)[1]["GET"]  # type: ignore[arg-type]
+    assert list(routes.hits) == ["users/5"]
+    assert resolve_gateway_api("users/404x/extra", "GET", None) is None  # type: ignore[arg-type]
+    assert list(routes.hits) == ["users/5"]
+    second = resolve_gateway_api("users/5", "GET", None)  # type: ignore[arg-type]
+    assert second is not None
+    assert second[0] is a_user
+    assert second[1] == {"id": "5"}
+
+
+def test_resolve_embedded_params_without_regex(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    a_file, a_pair = _routes(
+        monkeypatch,
+        ("files/f-{name}-v/raw", HttpMethodEnum.GET),
+        ("pairs/{a}-{b}", HttpMethodEnum.GET),
+    )
+    api, params, _ = resolve_gateway_api("files/f-report-v/raw", "GET", None)  # type: ignore[arg-type]
+    assert api is a_file
+    assert params == {"name": "report"}
+    assert resolve_gateway_api("files/f--v/raw", "GET", None) is None  # type: ignore[arg-type]
+    # Several params in one segment still go through the regex (greedy split)
+    api, params, _ = resolve_gateway_api("pairs/x-y-z", "GET", None)  # type: ignore[arg-type]
+    assert api is a_pair
+    assert params == {"a": "x-y", "b": "z"}
+
+
+def test_resolve_literal_brace_spanning_slash_matches_like_regex(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # "{q/{id}" is one non-identifier placeholder to path_to_regex: all literal
+    (a_lit,) = _routes(monkeypatch, ("b/{q/{id}", HttpMethodEnum.GET))
+    assert resolve_gateway_api("b/{q/7", "GET", None) is None  # type: ignore[arg-type]
+    resolved = resolve_gateway_api("b/{q/{id}", "GET", None)  # type: ignore[arg-type]
+    assert resolved is not None
+    assert resolved[0] is a_lit
+    assert resolved[1] == {}
+
+
+def test_resolve_multi_param_segments_share_one_regex(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    a_range, a_pair, a_dims = _routes(
+        monkeypatch,
+        ("range/{lo}..{hi}", HttpMethodEnum.GET),
+        ("pairs/{a}-{b}", HttpMethodEnum.GET),
+        ("pairs/{w}x{h}", HttpMethodEnum.GET),
+    )
+    combined = resolver._get_route_table(None)[1]["GET"].combined  # type: ignore[arg-type]
+    assert [leaf[2] for leaf in combined[2][1]] == [a_range, a_pair, a_dims]
+
+    api, params, _ = resolve_gateway_api("range/1..9", "GET", None)  # type: ignore[arg-type]
+    assert api is a_range
+    assert params == {"lo": "1", "hi": "9"}
+    # Both pair patterns match: the higher-priority alternative wins
+    api, params, _ = resolve_gateway_api("pairs/2x-3", "GET", None)  # type: ignore[arg-type]
+    assert api is a_pair
+    assert params == {"a": "2x", "b": "3"}
+    api, params, _ = resolve_gateway_api("pairs/2x3", "GET", None)  # type: ignore[arg-type]
+    assert api is a_dims
+    assert params == {"w": "2", "h": "3"}
@@ -30,6 +30,10 @@ class _FakeCursor:
     def fetchall(self):
         return list(self._rows)
 
+    def fetchmany(self, size):
+        batch, self._rows = list(self._rows[:size]), self._rows[size:]
+        return batch
+
 
 # pymysql FIELD_TYPE codes
 FT_TINY = 1      # TINYINT (and TINYINT(1) == BOOLEAN)
@@ -182,6 +186,15 @@ def test_multiple_bool_columns_in_same_row():
     }]
 
 
+def test_rows_fetched_in_chunks_are_all_coerced():
+    cur = _FakeCursor(
+        _pymysql_desc(("id", FT_LONG, 11), ("flag", FT_TINY, 1)),
+        rows=[(i, i % 2) for i in range(5)],
+    )
+    result = cursor_to_dicts(cur, chunk_size=2)
+    assert result == [{"id": i, "flag": bool(i % 2)} for i in range(5)]
+
+
 def test_setting_disabled_no_coercion():
     cur = _FakeCursor(
         _pymysql_desc(("is_active", FT_TINY, 1)),
@@ -5,8 +5,12 @@ Requires Postgres and MySQL from docker-compose.test.yml (e.g. make integration-
 Uses POSTGRES_* and MYSQL_* from env (integration-test.sh exports them).
 """
 
+import functools
 import os
 import uuid
+from collections.abc import Generator, Mapping
+from types import MappingProxyType
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -22,26 +26,34 @@ from app.core.security import encrypt_value
 from app.models_dbapi import DataSource, ProductTypeEnum
 
 
-def _pg_params() -> dict:
-    return {
-        "product_type": ProductTypeEnum.POSTGRES,
-        "host": os.environ.get("POSTGRES_SERVER", "localhost"),
-        "port": int(os.environ.get("POSTGRES_PORT", "5432")),
-        "database": os.environ.get("POSTGRES_DB", "app"),
-        "username": os.environ.get("POSTGRES_USER", "postgres"),
-        "password": encrypt_value(os.environ.get("POSTGRES_PASSWORD", "postgres")),
-    }
+@functools.cache
+def _pg_params() -> Mapping[str, Any]:
+    # Read once (env lookups + encrypt_value); read-only since it is shared
+    return MappingProxyType(
+        {
+            "product_type": ProductTypeEnum.POSTGRES,
+            "host": os.environ.get("POSTGRES_SERVER", "localhost"),
+            "port": int(os.environ.get("POSTGRES_PORT", "5432")),
+            "database": os.environ.get("POSTGRES_DB", "app"),
+            "username": os.environ.get("POSTGRES_USER", "postgres"),
+            "password": encrypt_value(os.environ.get("POSTGRES_PASSWORD", "postgres")),
+        }
+    )
 
 
-def _mysql_params() -> dict:
-    return {
-        "product_type": ProductTypeEnum.MYSQL,
-        "host": os.environ.get("MYSQL_HOST", "localhost"),
-        "port": int(os.environ.get("MYSQL_PORT", "3306")),
-        "database": os.environ.get("MYSQL_DATABASE", "app"),
-        "username": os.environ.get("MYSQL_USER", "app"),
-        "password": encrypt_value(os.environ.get("MYSQL_PASSWORD", "app")),
-    }
+@functools.cache
+def _mysql_params() -> Mapping[str, Any]:
+    # Read once (env lookups + encrypt_value); read-only since it is shared
+    return MappingProxyType(
+        {
+            "product_type": ProductTypeEnum.MYSQL,
+            "host": os.environ.get("MYSQL_HOST", "localhost"),
+            "port": int(os.environ.get("MYSQL_PORT", "3306")),
+            "database": os.environ.get("MYSQL_DATABASE", "app"),
+            "username": os.environ.get("MYSQL_USER", "app"),
+            "password": encrypt_value(os.environ.get("MYSQL_PASSWORD", "app")),
+        }
+    )
 
 
 def _pg_datasource() -> DataSource:
@@ -72,12 +84,24 @@ def _mysql_datasource() -> DataSource:
     )
 
 
+# DataSource is a table model: built once per module and shared, since its
+# constructor goes through SQLAlchemy instrumentation (model_construct would not).
+@pytest.fixture(scope="module")
+def pg_datasource() -> DataSource:
+    return _pg_datasource()
+
+
+@pytest.fixture(scope="module")
+def mysql_datasource() -> DataSource:
+    return _mysql_datasource()
+
+
 # --- connect + health_check + execute + cursor_to_dicts ---
 
 
 def test_connect_postgres() -> None:
     """Connect to Postgres, health_check, execute SELECT 1, cursor_to_dicts, close."""
-    params = _pg_params()
+    params = dict(_pg_params())
     conn = connect(params)
     try:
         assert health_check(conn, ProductTypeEnum.POSTGRES) is True
@@ -92,7 +116,7 @@ def test_connect_postgres() -> None:
 
 def test_connect_mysql() -> None:
     """Connect to MySQL, health_check, execute SELECT 1, cursor_to_dicts, close."""
-    params = _mysql_params()
+    params = dict(_mysql_params())
     try:
         conn = connect(params)
     except Exception:
@@ -108,9 +132,9 @@ def test_connect_mysql() -> None:
         conn.close()
 
 
-def test_connect_postgres_with_datasource_model() -> None:
+def test_connect_postgres_with_datasource_model(pg_datasource: DataSource) -> None:
     """connect() accepts a DataSource model (not only dict)."""
-    ds = _pg_datasource()
+    ds = pg_datasource
     conn = connect(ds)
     try:
         assert health_check(conn, ds.product_type) is True
@@ -118,9 +142,9 @@ def test_connect_postgres_with_datasource_model() -> None:
         conn.close()
 
 
-def test_connect_mysql_with_datasource_model() -> None:
+def test_connect_mysql_with_datasource_model(mysql_datasource: DataSource) -> None:
     """connect() accepts a DataSource model for MySQL."""
-    ds = _mysql_datasource()
+    ds = mysql_datasource
     try:
         conn = connect(ds)
     except Exception:
@@ -133,7 +157,7 @@ def test_connect_mysql_with_datasource_model() -> None:
 
 def test_connect_invalid_product_type() -> None:
     """connect() raises ValueError for unsupported product_type."""
-    params = _pg_params()
+    params = dict(_pg_params())
     params["product_type"] = "oracle"  # type: ignore[typeddict-unknown-key]
     with pytest.raises(ValueError, match="oracle|ProductTypeEnum|Unsupported"):
         connect(params)
@@ -141,49 +165,124 @@ def test_connect_invalid_product_type() -> None:
 
 def test_health_check_fails_on_closed_connection() -> None:
     """health_check returns False when connection is closed (execute raises, we catch and return False)."""
-    params = _pg_params()
+    params = dict(_pg_params())
     conn = connect(params)
     conn.close()
     ok = health_check(conn, ProductTypeEnum.POSTGRES)
     assert ok is False
 
 
+class _FakeCursor:
+    """Records every execute() as (sql, params); one-row ``n`` result."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+        self.description = [("n",)]
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        self.calls.append((sql, params if params is not None else ()))
+
+    def fetchall(self) -> list[tuple[int]]:
+        return [(1,)]
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeConn:
+    """Connection whose cursor() always returns the same recording cursor."""
+
+    def __init__(self) -> None:
+        self.cur = _FakeCursor()
+
+    def cursor(self) -> _FakeCursor:
+        return self.cur
+
+
 @patch("app.core.pool.connect.settings")
 def test_execute_applies_statement_timeout_when_configured(
     mock_settings: MagicMock,
 ) -> None:
-    """When EXTERNAL_DB_STATEMENT_TIMEOUT is set, execute() runs SET statement_timeout (Postgres) before query and resets after."""
+    """When EXTERNAL_DB_STATEMENT_TIMEOUT is set, execute() runs SET LOCAL statement_timeout (Postgres) before the query; it reverts with the transaction, so no reset."""
     mock_settings.EXTERNAL_DB_STATEMENT_TIMEOUT = 5
-    calls: list[tuple[str, tuple]] = []
-    mock_cur = MagicMock()
-    mock_cur.execute = lambda s, p=None: calls.append((s, p if p is not None else ()))
-    mock_cur.description = [("n",)]
-    mock_cur.fetchall = lambda: [(1,)]
-    mock_cur.close = lambda: None
-    mock_conn = MagicMock()
-    mock_conn.cursor.return_value = mock_cur
+    conn = _FakeConn()
 
     cur = execute(
-        mock_conn,
+        conn,
         "SELECT 1 AS n",
         product_type=ProductTypeEnum.POSTGRES,
     )
 
-    assert len(calls) >= 2
-    assert "statement_timeout" in calls[0][0]
+    calls = conn.cur.calls
+    assert len(calls) == 2
+    assert "SET LOCAL statement_timeout" in calls[0][0]
     assert "5000" in str(calls[0][1])
     assert calls[1][0] == "SELECT 1 AS n"
-    assert "statement_timeout" in calls[2][0] and "0" in calls[2][0]
-    assert cur is mock_cur
+    assert cur is conn.cur
+
+
+@patch("app.core.pool.connect.settings")
+def test_execute_mysql_statement_timeout_is_sticky_per_connection(
+    mock_settings: MagicMock,
+) -> None:
+    """MySQL session timeout is SET once per connection, and again only when it changes."""
+    mock_settings.EXTERNAL_DB_STATEMENT_TIMEOUT = 5
+    conn = _FakeConn()
+
+    execute(conn, "SELECT 1", product_type=ProductTypeEnum.MYSQL)
+    execute(conn, "SELECT 2", product_type=ProductTypeEnum.MYSQL)
+    assert [sql for sql, _ in conn.cur.calls] == [
+        "SET SESSION max_execution_time = %s",
+        "SELECT 1",
+        "SELECT 2",
+    ]
+
+    conn.cur.calls.clear()
+    mock_settings.EXTERNAL_DB_STATEMENT_TIMEOUT = None
+    execute(conn, "SELECT 3", product_type=ProductTypeEnum.MYSQL)
+    assert conn.cur.calls == [
+        ("SET SESSION max_execution_time = %s", (0,)),
+        ("SELECT 3", ()),
+    ]
 
 
 # --- PoolManager ---
 
 
-def test_pool_manager_postgres_get_release() -> None:
+@pytest.fixture(scope="module")
+def pooled_pg_datasource(
+    pg_datasource: DataSource,
+) -> Generator[DataSource, None, None]:
+    """The module's Postgres DataSource with its pool pre-warmed, disposed at teardown."""
+    pm = get_pool_manager()
+    ds = pg_datasource
+    pm.release(pm.get_connection(ds), ds.id)
+    yield ds
+    pm.dispose(ds.id)
+
+
+@pytest.fixture(scope="module")
+def pooled_mysql_datasource(
+    mysql_datasource: DataSource,
+) -> Generator[DataSource, None, None]:
+    """The module's MySQL DataSource with its pool pre-warmed, disposed at teardown."""
+    pm = get_pool_manager()
+    ds = mysql_datasource
+    try:
+        conn = pm.get_connection(ds)
+    except Exception:
+        pytest.skip("MySQL not available")
+    pm.release(conn, ds.id)
+    yield ds
+    pm.dispose(ds.id)
+
+
+def test_pool_manager_postgres_get_release(
+    pooled_pg_datasource: DataSource,
+) -> None:
     """PoolManager: get_connection(DataSource), release, get again reuses or creates."""
     pm = get_pool_manager()
-    ds = _pg_datasource()
+    ds = pooled_pg_datasource
     conn1 = pm.get_connection(ds)
     try:
         assert health_check(conn1, ProductTypeEnum.POSTGRES) is True
@@ -197,17 +296,15 @@ def test_pool_manager_postgres_get_release() -> None:
         assert health_check(conn2, ProductTypeEnum.POSTGRES) is True
     finally:
         pm.release(conn2, ds.id)
-    pm.dispose(ds.id)
 
 
-def test_pool_manager_mysql_get_release() -> None:
+def test_pool_manager_mysql_get_release(
+    pooled_mysql_datasource: DataSource,
+) -> None:
     """PoolManager: get_connection(DataSource) and release for MySQL."""
     pm = get_pool_manager()
-    ds = _mysql_datasource()
-    try:
-        conn = pm.get_connection(ds)
-    except Exception:
-        pytest.skip("MySQL not available")
+    ds = pooled_mysql_datasource
+    conn = pm.get_connection(ds)
     try:
         assert health_check(conn, ProductTypeEnum.MYSQL) is True
         cur = execute(conn, "SELECT 1 AS y")
@@ -215,4 +312,3 @@ def test_pool_manager_mysql_get_release() -> None:
         cur.close()
     finally:
         pm.release(conn, ds.id)
-    pm.dispose(ds.id)
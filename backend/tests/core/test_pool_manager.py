@@ -8,6 +8,8 @@ import time
 import uuid
 from unittest.mock import MagicMock, patch
 
+import psycopg
+
 from app.core.pool.manager import PoolManager, _PoolEntry
 
 
@@ -157,3 +159,17 @@ class TestPoolManagerDispose:
         stats = pm.stats()
         assert stats["datasources"] == 2
         assert stats["idle_connections"] == 5
+
+
+class TestPoolManagerPing:
+    def test_psycopg_ping_is_prepared(self):
+        conn = MagicMock(spec=psycopg.Connection)
+        assert PoolManager._is_alive(conn) is True
+        conn.cursor.return_value.execute.assert_called_once_with(
+            "SELECT 1", prepare=True
+        )
+
+    def test_other_driver_ping_is_plain(self):
+        conn = _make_mock_conn()
+        assert PoolManager._is_alive(conn) is True
+        conn.cursor.return_value.execute.assert_called_once_with("SELECT 1")
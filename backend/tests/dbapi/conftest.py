@@ -0,0 +1,11 @@
+"""Shared fixtures for DBAPI model tests."""
+
+import pytest
+from sqlalchemy import inspect
+from sqlmodel import Session
+
+
+@pytest.fixture(scope="session")
+def dbapi_table_names(db: Session) -> frozenset[str]:
+    """Table names in the test database, inspected once per session."""
+    return frozenset(inspect(db.get_bind()).get_table_names())
@@ -1,7 +1,6 @@
 """Smoke tests for DBAPI models (import and table names)."""
 
 import pytest
-from sqlalchemy import inspect
 from sqlmodel import Session, select
 
 from app.models_dbapi import (
@@ -37,9 +36,9 @@ def test_models_dbapi_import():
     assert ExecuteEngineEnum.SQL.value == "SQL"
 
 
-def test_datasource_crud(db: Session):
+def test_datasource_crud(db: Session, dbapi_table_names: frozenset[str]):
     """Create and read DataSource. Skipped if DBAPI migrations not applied."""
-    if "datasource" not in inspect(db.get_bind()).get_table_names():
+    if "datasource" not in dbapi_table_names:
         pytest.skip(
             "datasource table not found; run: make migrate or make integration-test"
         )
@@ -1,8 +1,18 @@
-"""Clean up report tables after engine tests to avoid FK violations in global teardown."""
+"""Shared engine-test fixtures.
+
+Also cleans up report tables after engine tests to avoid FK violations in
+global teardown.
+"""
+
+from collections.abc import Generator
+from unittest.mock import MagicMock, create_autospec
+
 import pytest
 from sqlalchemy import delete
 from sqlmodel import Session
 
+from app.engines.executor import ApiExecutor
+from app.models_dbapi import DataSource, ProductTypeEnum
 from app.models_report import (
     ReportExecution,
     ReportModule,
@@ -11,6 +21,7 @@ from app.models_report import (
     ReportTemplate,
     ReportTemplateClientLink,
 )
+from tests.utils.utils import sequential_uuid
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -26,3 +37,41 @@ def _cleanup_report_tables(db: Session):
     ]:
         db.execute(delete(model))
     db.commit()
+
+
+@pytest.fixture(scope="session")
+def _mock_session_proto() -> MagicMock:
+    """Autospec'd Session mock, built once (autospeccing takes tens of ms)."""
+    return create_autospec(Session, instance=True, spec_set=True)
+
+
+@pytest.fixture
+def mock_session(_mock_session_proto: MagicMock) -> Generator[MagicMock, None, None]:
+    """Per-test view of the shared Session mock; reset after each test.
+
+    A ``copy.copy`` of a MagicMock shares its child mocks with the original,
+    so the prototype is handed out directly and reset in teardown instead.
+    """
+    yield _mock_session_proto
+    _mock_session_proto.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def sample_datasource() -> DataSource:
+    """One unsaved Postgres DataSource shared by engine tests; treat as read-only."""
+    return DataSource(
+        id=sequential_uuid(),
+        name="test-ds",
+        product_type=ProductTypeEnum.POSTGRES,
+        host="localhost",
+        port=5432,
+        database="db",
+        username="u",
+        password="p",
+    )
+
+
+@pytest.fixture(scope="module")
+def executor() -> ApiExecutor:
+    """ApiExecutor is stateless between execute() calls; share one per module."""
+    return ApiExecutor()
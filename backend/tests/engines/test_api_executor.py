@@ -1,168 +1,182 @@
 """Unit tests for ApiExecutor (Phase 3, Task 3.4)."""
 
-import uuid
-from unittest.mock import MagicMock, patch
+from collections.abc import Generator
+from unittest.mock import DEFAULT, MagicMock, call, patch
 
 import pytest
 
+from app.engines import executor as executor_module
 from app.engines.executor import ApiExecutor
-from app.models_dbapi import DataSource, ExecuteEngineEnum, ProductTypeEnum
-
-
-def _make_datasource() -> DataSource:
-    return DataSource(
-        id=uuid.uuid4(),
-        name="test-ds",
-        product_type=ProductTypeEnum.POSTGRES,
-        host="localhost",
-        port=5432,
-        database="db",
-        username="u",
-        password="p",
-    )
+from app.models_dbapi import DataSource, ExecuteEngineEnum
+from tests.utils.utils import sequential_uuid
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _null_pool_manager() -> Generator[None, None, None]:
+    """Keep every test in this module off the real pool manager (patched once)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(executor_module, "get_pool_manager", MagicMock())
+        yield
+
+
+@pytest.fixture
+def sql_mocks() -> Generator[dict[str, MagicMock], None, None]:
+    """Patch the SQL engine's collaborators in one go."""
+    with patch.multiple(
+        executor_module, execute_sql=DEFAULT, SQLTemplateEngine=DEFAULT
+    ) as mocks:
+        yield mocks
+
+
+@pytest.fixture
+def script_mocks() -> Generator[dict[str, MagicMock], None, None]:
+    """Patch the SCRIPT engine's collaborators in one go."""
+    with patch.multiple(
+        executor_module, ScriptExecutor=DEFAULT, ScriptContext=DEFAULT
+    ) as mocks:
+        yield mocks
 
 
 # --- SQL engine ---
 
 
-@patch("app.engines.executor.execute_sql")
-@patch("app.engines.executor.SQLTemplateEngine")
 def test_api_executor_sql_returns_data(
-    mock_engine_cls: MagicMock,
-    mock_execute_sql: MagicMock,
+    sql_mocks: dict[str, MagicMock],
+    sample_datasource: DataSource,
+    executor: ApiExecutor,
 ) -> None:
-    ds = _make_datasource()
+    mock_engine_cls = sql_mocks["SQLTemplateEngine"]
+    mock_execute_sql = sql_mocks["execute_sql"]
     mock_engine_cls.return_value.render.return_value = "SELECT 1 AS n"
     # execute_sql returns list of statement results (one stmt -> one element)
     mock_execute_sql.return_value = [[{"n": 1}, {"n": 2}]]
 
-    out = ApiExecutor().execute(
+    out = executor.execute(
         engine=ExecuteEngineEnum.SQL,
         content="SELECT 1 AS n",
         params={"x": 1},
-        datasource=ds,
+        datasource=sample_datasource,
     )
 
     assert out == {"data": [[{"n": 1}, {"n": 2}]]}
-    mock_engine_cls.return_value.render.assert_called_once_with(
-        "SELECT 1 AS n", {"x": 1}
-    )
-    mock_execute_sql.assert_called_once_with(ds, "SELECT 1 AS n", use_pool=True)
+    assert mock_engine_cls.return_value.render.call_args_list == [
+        call("SELECT 1 AS n", {"x": 1})
+    ]
+    assert mock_execute_sql.call_args_list == [
+        call(sample_datasource, "SELECT 1 AS n", use_pool=True)
+    ]
 
 
-@patch("app.engines.executor.execute_sql")
-@patch("app.engines.executor.SQLTemplateEngine")
 def test_api_executor_sql_returns_rowcount(
-    mock_engine_cls: MagicMock,
-    mock_execute_sql: MagicMock,
+    sql_mocks: dict[str, MagicMock],
+    sample_datasource: DataSource,
+    executor: ApiExecutor,
 ) -> None:
-    ds = _make_datasource()
+    mock_engine_cls = sql_mocks["SQLTemplateEngine"]
+    mock_execute_sql = sql_mocks["execute_sql"]
     mock_engine_cls.return_value.render.return_value = "INSERT INTO t (a) VALUES (1)"
     # execute_sql returns list of statement results (one stmt -> one element = rowcount)
     mock_execute_sql.return_value = [3]
 
-    out = ApiExecutor().execute(
+    out = executor.execute(
         engine=ExecuteEngineEnum.SQL,
         content="INSERT INTO t (a) VALUES (1)",
         params={},
-        datasource=ds,
+        datasource=sample_datasource,
     )
 
     assert out == {"data": [3]}
     mock_execute_sql.assert_called_once()
 
 
-@patch("app.engines.executor.execute_sql")
-@patch("app.engines.executor.SQLTemplateEngine")
 def test_api_executor_sql_loads_datasource_from_session(
-    mock_engine_cls: MagicMock,
-    mock_execute_sql: MagicMock,
+    sql_mocks: dict[str, MagicMock],
+    mock_session: MagicMock,
+    sample_datasource: DataSource,
+    executor: ApiExecutor,
 ) -> None:
-    ds = _make_datasource()
-    mock_session = MagicMock()
-    mock_session.get.return_value = ds
+    mock_engine_cls = sql_mocks["SQLTemplateEngine"]
+    mock_execute_sql = sql_mocks["execute_sql"]
+    mock_session.get.return_value = sample_datasource
     mock_engine_cls.return_value.render.return_value = "SELECT 1"
     # execute_sql returns list of statement results
     mock_execute_sql.return_value = [[]]
 
-    out = ApiExecutor().execute(
+    out = executor.execute(
         engine=ExecuteEngineEnum.SQL,
         content="SELECT 1",
-        datasource_id=ds.id,
+        datasource_id=sample_datasource.id,
         session=mock_session,
     )
 
     assert out == {"data": [[]]}
     mock_session.get.assert_called_once()
-    assert mock_session.get.call_args[0][1] == ds.id
-    mock_execute_sql.assert_called_once_with(ds, "SELECT 1", use_pool=True)
+    assert mock_session.get.call_args[0][1] == sample_datasource.id
+    assert mock_execute_sql.call_args_list == [
+        call(sample_datasource, "SELECT 1", use_pool=True)
+    ]
 
 
 # --- SCRIPT engine ---
 
 
-@patch("app.engines.executor.ScriptExecutor")
-@patch("app.engines.executor.ScriptContext")
-@patch("app.engines.executor.get_pool_manager")
 def test_api_executor_script_returns_data(
-    _mock_get_pm: MagicMock,
-    mock_ctx_cls: MagicMock,
-    mock_se_cls: MagicMock,
+    script_mocks: dict[str, MagicMock],
+    sample_datasource: DataSource,
+    executor: ApiExecutor,
 ) -> None:
-    ds = _make_datasource()
+    mock_ctx_cls = script_mocks["ScriptContext"]
+    mock_se_cls = script_mocks["ScriptExecutor"]
     mock_ctx = MagicMock()
     mock_ctx.to_dict.return_value = {}
     mock_ctx_cls.return_value = mock_ctx
     mock_se_cls.return_value.execute.return_value = [1, 2, 3]
 
-    out = ApiExecutor().execute(
+    out = executor.execute(
         engine=ExecuteEngineEnum.SCRIPT,
         content="result = [1,2,3]",
         params={"key": "v"},
-        datasource=ds,
+        datasource=sample_datasource,
     )
 
     assert out == {"data": [1, 2, 3]}
     mock_ctx_cls.assert_called_once()
-    mock_se_cls.return_value.execute.assert_called_once_with(
-        "result = [1,2,3]", mock_ctx
-    )
+    assert mock_se_cls.return_value.execute.call_args_list == [
+        call("result = [1,2,3]", mock_ctx)
+    ]
 
 
-@patch("app.engines.executor.ScriptExecutor")
-@patch("app.engines.executor.ScriptContext")
-@patch("app.engines.executor.get_pool_manager")
 def test_api_executor_script_loads_datasource_from_session(
-    _mock_get_pm: MagicMock,
-    mock_ctx_cls: MagicMock,
-    mock_se_cls: MagicMock,
+    script_mocks: dict[str, MagicMock],
+    mock_session: MagicMock,
+    sample_datasource: DataSource,
+    executor: ApiExecutor,
 ) -> None:
-    ds = _make_datasource()
-    mock_session = MagicMock()
-    mock_session.get.return_value = ds
+    mock_ctx_cls = script_mocks["ScriptContext"]
+    mock_se_cls = script_mocks["ScriptExecutor"]
+    mock_session.get.return_value = sample_datasource
     mock_ctx = MagicMock()
     mock_ctx_cls.return_value = mock_ctx
     mock_se_cls.return_value.execute.return_value = {"ok": True}
 
-    out = ApiExecutor().execute(
+    out = executor.execute(
         engine=ExecuteEngineEnum.SCRIPT,
         content="result = {'ok': True}",
-        datasource_id=ds.id,
+        datasource_id=sample_datasource.id,
         session=mock_session,
     )
 
     assert out == {"data": {"ok": True}}
     mock_session.get.assert_called_once()
-    assert mock_session.get.call_args[0][1] == ds.id
+    assert mock_session.get.call_args[0][1] == sample_datasource.id
 
 
 # --- Validation ---
 
 
-def test_api_executor_sql_no_datasource_raises() -> None:
-    ex = ApiExecutor()
+def test_api_executor_sql_no_datasource_raises(executor: ApiExecutor) -> None:
     with pytest.raises(ValueError, match="datasource or datasource_id is required"):
-        ex.execute(
+        executor.execute(
             engine=ExecuteEngineEnum.SQL,
             content="SELECT 1",
             datasource=None,
@@ -170,10 +184,9 @@ def test_api_executor_sql_no_datasource_raises() -> None:
         )
 
 
-def test_api_executor_script_no_datasource_raises() -> None:
-    ex = ApiExecutor()
+def test_api_executor_script_no_datasource_raises(executor: ApiExecutor) -> None:
     with pytest.raises(ValueError, match="datasource or datasource_id is required"):
-        ex.execute(
+        executor.execute(
             engine=ExecuteEngineEnum.SCRIPT,
             content="result=1",
             datasource=None,
@@ -181,41 +194,38 @@ def test_api_executor_script_no_datasource_raises() -> None:
         )
 
 
-def test_api_executor_datasource_id_without_session_raises() -> None:
-    ex = ApiExecutor()
+def test_api_executor_datasource_id_without_session_raises(
+    executor: ApiExecutor,
+) -> None:
     with pytest.raises(ValueError, match="session is required"):
-        ex.execute(
+        executor.execute(
             engine=ExecuteEngineEnum.SQL,
             content="SELECT 1",
-            datasource_id=uuid.uuid4(),
+            datasource_id=sequential_uuid(),
             session=None,
         )
 
 
-@patch("app.engines.executor.execute_sql")
-@patch("app.engines.executor.SQLTemplateEngine")
+@pytest.mark.usefixtures("sql_mocks")
 def test_api_executor_datasource_not_found_raises(
-    _mock_engine: MagicMock,
-    _mock_execute_sql: MagicMock,
+    mock_session: MagicMock, executor: ApiExecutor
 ) -> None:
-    mock_session = MagicMock()
     mock_session.get.return_value = None
-    ex = ApiExecutor()
     with pytest.raises(ValueError, match="DataSource not found"):
-        ex.execute(
+        executor.execute(
             engine=ExecuteEngineEnum.SQL,
             content="SELECT 1",
-            datasource_id=uuid.uuid4(),
+            datasource_id=sequential_uuid(),
             session=mock_session,
         )
 
 
-def test_api_executor_unsupported_engine_raises() -> None:
-    ds = _make_datasource()
-    ex = ApiExecutor()
+def test_api_executor_unsupported_engine_raises(
+    sample_datasource: DataSource, executor: ApiExecutor
+) -> None:
     with pytest.raises(ValueError, match="Unsupported engine"):
-        ex.execute(
+        executor.execute(
             engine=MagicMock(value="RUST"),  # type: ignore[arg-type]
             content="x",
-            datasource=ds,
+            datasource=sample_datasource,
         )
@@ -7,21 +7,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from app.engines.script import ScriptContext, ScriptExecutor
+from app.engines.script import executor as script_executor_module
 from app.engines.script.executor import ScriptTimeoutError
-from app.models_dbapi import DataSource, ProductTypeEnum
-
-
-def _make_datasource() -> DataSource:
-    return DataSource(
-        id=uuid.uuid4(),
-        name="test",
-        product_type=ProductTypeEnum.POSTGRES,
-        host="localhost",
-        port=5432,
-        database="db",
-        username="u",
-        password="p",
-    )
+from app.models_dbapi import DataSource
 
 
 class MockPool:
@@ -32,19 +20,26 @@ class MockPool:
         pass
 
 
+_EXECUTE_STYLE_SCRIPT = (
+    "def execute(params=None):\n"
+    "    params = params or {}\n"
+    "    return [params.get('a', 0), params.get('b', 0)]\n"
+)
+
+
 class TestScriptExecutorBasic:
-    def test_result_list(self) -> None:
+    def test_result_list(self, sample_datasource: DataSource) -> None:
         ctx = ScriptContext(
-            datasource=_make_datasource(),
+            datasource=sample_datasource,
             req={},
             pool_manager=MockPool(),
         )
         out = ScriptExecutor().execute("result = [1, 2, 3]", ctx)
         assert out == [1, 2, 3]
 
-    def test_result_from_comprehension(self) -> None:
+    def test_result_from_comprehension(self, sample_datasource: DataSource) -> None:
         ctx = ScriptContext(
-            datasource=_make_datasource(),
+            datasource=sample_datasource,
             req={"ids": [1, 2, 3]},
             pool_manager=MockPool(),
         )
@@ -53,25 +48,22 @@ class TestScriptExecutorBasic:
         )
         assert out == [2, 4, 6]
 
-    def test_execute_function_style(self) -> None:
+    def test_execute_function_style(self, sample_datasource: DataSource) -> None:
         """When script defines execute(params), it is called with req and return value is used."""
         ctx = ScriptContext(
-            datasource=_make_datasource(),
+            datasource=sample_datasource,
             req={"a": 1, "b": 2},
             pool_manager=MockPool(),
         )
-        script = (
-            "def execute(params=None):\n"
-            "    params = params or {}\n"
-            "    return [params.get('a', 0), params.get('b', 0)]\n"
-        )
-        out = ScriptExecutor().execute(script, ctx)
+        out = ScriptExecutor().execute(_EXECUTE_STYLE_SCRIPT, ctx)
         assert out == [1, 2]
 
-    def test_no_result_returns_default_envelope(self) -> None:
+    def test_no_result_returns_default_envelope(
+        self, sample_datasource: DataSource
+    ) -> None:
         """When script doesn't set 'result', the default envelope from ScriptContext is returned."""
         ctx = ScriptContext(
-            datasource=_make_datasource(),
+            datasource=sample_datasource,
             req={},
             pool_manager=MockPool(),
         )
@@ -80,9 +72,9 @@ class TestScriptExecutorBasic:
         assert out["success"] is True
         assert out["data"] == []
 
-    def test_open_blocked(self) -> None:
+    def test_open_blocked(self, sample_datasource: DataSource) -> None:
         ctx = ScriptContext(
-            datasource=_make_datasource(),
+            datasource=sample_datasource,
             req={},
             pool_manager=MockPool(),
         )
@@ -90,13 +82,15 @@ class TestScriptExecutorBasic:
             ScriptExecutor().execute("result = open('/etc/passwd')", ctx)
 
 
-@patch("app.engines.script.executor.settings")
-def test_script_executor_timeout_raises(mock_settings: MagicMock) -> None:
+@patch.object(script_executor_module, "settings")
+def test_script_executor_timeout_raises(
+    mock_settings: MagicMock, sample_datasource: DataSource
+) -> None:
     """When SCRIPT_EXEC_TIMEOUT is set, a long-running script raises ScriptTimeoutError."""
-    mock_settings.SCRIPT_EXEC_TIMEOUT = 1
+    mock_settings.SCRIPT_EXEC_TIMEOUT = 0.05
     mock_settings.SCRIPT_EXTRA_MODULES = ""
     ctx = ScriptContext(
-        datasource=_make_datasource(),
+        datasource=sample_datasource,
         req={},
         pool_manager=MockPool(),
     )
@@ -104,13 +98,15 @@ def test_script_executor_timeout_raises(mock_settings: MagicMock) -> None:
         ScriptExecutor().execute("while True: pass", ctx)
 
 
-@patch("app.engines.script.executor.settings")
-def test_script_executor_timeout_from_worker_thread(mock_settings: MagicMock) -> None:
+@patch.object(script_executor_module, "settings")
+def test_script_executor_timeout_from_worker_thread(
+    mock_settings: MagicMock, sample_datasource: DataSource
+) -> None:
     """Timeout works when executor runs inside a worker thread (mimics asyncio.to_thread)."""
-    mock_settings.SCRIPT_EXEC_TIMEOUT = 1
+    mock_settings.SCRIPT_EXEC_TIMEOUT = 0.05
     mock_settings.SCRIPT_EXTRA_MODULES = ""
     ctx = ScriptContext(
-        datasource=_make_datasource(),
+        datasource=sample_datasource,
         req={},
         pool_manager=MockPool(),
     )
@@ -130,13 +126,15 @@ def test_script_executor_timeout_from_worker_thread(mock_settings: MagicMock) ->
     assert isinstance(errors[0], ScriptTimeoutError)
 
 
-@patch("app.engines.script.executor.settings")
-def test_script_executor_completes_before_timeout(mock_settings: MagicMock) -> None:
+@patch.object(script_executor_module, "settings")
+def test_script_executor_completes_before_timeout(
+    mock_settings: MagicMock, sample_datasource: DataSource
+) -> None:
     """A script that finishes quickly returns its result even with timeout enabled."""
     mock_settings.SCRIPT_EXEC_TIMEOUT = 5
     mock_settings.SCRIPT_EXTRA_MODULES = ""
     ctx = ScriptContext(
-        datasource=_make_datasource(),
+        datasource=sample_datasource,
         req={},
         pool_manager=MockPool(),
     )
@@ -144,15 +142,16 @@ def test_script_executor_completes_before_timeout(mock_settings: MagicMock) -> N
     assert out == 42
 
 
-@patch("app.engines.script.executor.settings")
+@patch.object(script_executor_module, "settings")
 def test_script_executor_exception_propagates_with_timeout(
     mock_settings: MagicMock,
+    sample_datasource: DataSource,
 ) -> None:
     """Script errors propagate correctly through the thread boundary."""
     mock_settings.SCRIPT_EXEC_TIMEOUT = 5
     mock_settings.SCRIPT_EXTRA_MODULES = ""
     ctx = ScriptContext(
-        datasource=_make_datasource(),
+        datasource=sample_datasource,
         req={},
         pool_manager=MockPool(),
     )
@@ -161,9 +160,11 @@ def test_script_executor_exception_propagates_with_timeout(
 
 
 class TestScriptContextToDict:
-    def test_has_db_http_cache_env_log_req_tx_ds(self) -> None:
+    def test_has_db_http_cache_env_log_req_tx_ds(
+        self, sample_datasource: DataSource
+    ) -> None:
         ctx = ScriptContext(
-            datasource=_make_datasource(),
+            datasource=sample_datasource,
             req={"k": "v"},
             pool_manager=MockPool(),
         )
@@ -177,5 +178,5 @@ class TestScriptContextToDict:
         assert d["req"] == {"k": "v"}
         assert "tx" in d
         assert "ds" in d
-        assert d["ds"]["name"] == "test"
+        assert d["ds"]["name"] == sample_datasource.name
         assert "password" not in str(d["ds"])
@@ -2,6 +2,7 @@
 
 import pytest
 
+from app.engines.script import sandbox
 from app.engines.script.sandbox import build_restricted_globals, compile_script
 
 
@@ -18,6 +19,15 @@ class TestCompileScript:
         with pytest.raises(SyntaxError):
             compile_script("def f(  ")
 
+    def test_compile_is_cached(self) -> None:
+        script = "result = 'cached-snippet'"
+        before = sandbox._compile_cached.cache_info()
+        code1 = compile_script(script)
+        code2 = compile_script(script)
+        after = sandbox._compile_cached.cache_info()
+        assert code1 is code2
+        assert after.hits >= before.hits + 1
+
 
 class TestBuildRestrictedGlobals:
     def test_includes_builtins_and_guards(self) -> None:
@@ -34,3 +44,12 @@ class TestBuildRestrictedGlobals:
         g = build_restricted_globals({"db": "db_obj", "req": {"a": 1}})
         assert g["db"] == "db_obj"
         assert g["req"] == {"a": 1}
+
+    def test_calls_do_not_share_namespaces(self) -> None:
+        g1 = build_restricted_globals({"req": {"a": 1}})
+        g1["json"] = None
+        g1["__builtins__"]["len"] = None
+        g2 = build_restricted_globals({})
+        assert "req" not in g2
+        assert g2["json"] is not None
+        assert g2["__builtins__"]["len"] is len
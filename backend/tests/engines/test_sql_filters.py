@@ -2,6 +2,8 @@
 
 from datetime import date, datetime
 
+import pytest
+
 from app.engines.sql.filters import (
     SqlSafe,
     compare,
@@ -20,147 +22,159 @@ from app.engines.sql.filters import (
     sql_string,
 )
 
+NULL_CASES = [
+    (sql_string, "NULL"),
+    (sql_int, "NULL"),
+    (sql_float, "NULL"),
+    (sql_bool, "NULL"),
+    (sql_date, "NULL"),
+    (sql_datetime, "NULL"),
+    (in_list, "(SELECT 1 WHERE 1=0)"),
+    (sql_like, "NULL"),
+    (sql_like_start, "NULL"),
+    (sql_like_end, "NULL"),
+    (sql_ident, ""),
+    (compare, ""),
+]
+
 
 class TestSqlSafe:
     """All filters should return SqlSafe instances."""
 
-    def test_sql_string_returns_safe(self):
-        assert isinstance(sql_string("hello"), SqlSafe)
-
-    def test_sql_int_returns_safe(self):
-        assert isinstance(sql_int(42), SqlSafe)
+    @pytest.mark.parametrize(
+        ("fn", "expected"), NULL_CASES, ids=[fn.__name__ for fn, _ in NULL_CASES]
+    )
+    def test_none(self, fn, expected):
+        result = fn(None)
+        assert result == expected
+        assert isinstance(result, SqlSafe)
 
-    def test_sql_int_returns_safe_instance(self):
-        assert isinstance(sql_int(1), SqlSafe)
+    @pytest.mark.parametrize(
+        ("fn", "value"),
+        [(sql_string, "hello"), (sql_int, 42), (sql_int, 1)],
+        ids=["sql_string", "sql_int", "sql_int_one"],
+    )
+    def test_returns_safe(self, fn, value):
+        assert isinstance(fn(value), SqlSafe)
 
 
 class TestSqlString:
-    def test_none(self):
-        assert sql_string(None) == "NULL"
-
-    def test_plain(self):
-        assert sql_string("hello") == "'hello'"
-
-    def test_quote_escape(self):
-        assert sql_string("a'b") == "'a''b'"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("hello", "'hello'"), ("a'b", "'a''b'")],
+        ids=["plain", "quote_escape"],
+    )
+    def test_render(self, value, expected):
+        assert sql_string(value) == expected
 
 
 class TestSqlInt:
-    def test_none(self):
-        assert sql_int(None) == "NULL"
-
-    def test_int(self):
-        assert sql_int(42) == "42"
-        assert sql_int("99") == "99"
-
-    def test_invalid(self):
-        assert sql_int("x") == "NULL"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(42, "42"), ("99", "99"), ("x", "NULL")],
+        ids=["int", "numeric_string", "invalid"],
+    )
+    def test_render(self, value, expected):
+        assert sql_int(value) == expected
 
 
 class TestSqlFloat:
-    def test_none(self):
-        assert sql_float(None) == "NULL"
-
-    def test_float(self):
-        assert sql_float(3.14) == "3.14"
-        assert sql_float("2.5") == "2.5"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(3.14, "3.14"), ("2.5", "2.5")],
+        ids=["float", "numeric_string"],
+    )
+    def test_render(self, value, expected):
+        assert sql_float(value) == expected
 
 
 class TestSqlBool:
-    def test_none(self):
-        assert sql_bool(None) == "NULL"
-
-    def test_true_false(self):
-        assert sql_bool(True) == "TRUE"
-        assert sql_bool(1) == "TRUE"
-        assert sql_bool(False) == "FALSE"
-        assert sql_bool(0) == "FALSE"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(True, "TRUE"), (1, "TRUE"), (False, "FALSE"), (0, "FALSE")],
+        ids=["true", "one", "false", "zero"],
+    )
+    def test_render(self, value, expected):
+        assert sql_bool(value) == expected
 
 
 class TestSqlDate:
-    def test_none(self):
-        assert sql_date(None) == "NULL"
-
-    def test_date(self):
-        assert sql_date(date(2025, 1, 15)) == "'2025-01-15'"
-
-    def test_datetime(self):
-        assert sql_date(datetime(2025, 1, 15, 12, 0)) == "'2025-01-15'"
-
-    def test_iso_string(self):
-        assert sql_date("2025-01-15") == "'2025-01-15'"
-        assert sql_date("2025-01-15T12:00:00") == "'2025-01-15'"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (date(2025, 1, 15), "'2025-01-15'"),
+            (datetime(2025, 1, 15, 12, 0), "'2025-01-15'"),
+            ("2025-01-15", "'2025-01-15'"),
+            ("2025-01-15T12:00:00", "'2025-01-15'"),
+        ],
+        ids=["date", "datetime", "iso_date", "iso_datetime"],
+    )
+    def test_render(self, value, expected):
+        assert sql_date(value) == expected
 
 
 class TestSqlDatetime:
-    def test_none(self):
-        assert sql_datetime(None) == "NULL"
-
-    def test_datetime(self):
-        assert sql_datetime(datetime(2025, 1, 15, 12, 30)) == "'2025-01-15T12:30:00'"
-
-    def test_string(self):
-        assert sql_datetime("2025-01-15 12:00:00") == "'2025-01-15 12:00:00'"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (datetime(2025, 1, 15, 12, 30), "'2025-01-15T12:30:00'"),
+            ("2025-01-15 12:00:00", "'2025-01-15 12:00:00'"),
+        ],
+        ids=["datetime", "string"],
+    )
+    def test_render(self, value, expected):
+        assert sql_datetime(value) == expected
 
 
 class TestInList:
-    def test_none(self):
-        assert in_list(None) == "(SELECT 1 WHERE 1=0)"
-
-    def test_empty(self):
-        assert in_list([]) == "(SELECT 1 WHERE 1=0)"
-
-    def test_ints(self):
-        assert in_list([1, 2, 3]) == "(1, 2, 3)"
-
-    def test_mixed(self):
-        assert in_list([1, "a", None]) == "(1, 'a', NULL)"
-
-    def test_quote_escape(self):
-        assert in_list(["o'brien"]) == "('o''brien')"
-
-
-class TestSqlLike:
-    def test_none(self):
-        assert sql_like(None) == "NULL"
-
-    def test_escape_percent_underscore(self):
-        assert "\\%" in sql_like("a%b")
-        assert "\\_" in sql_like("a_b")
-
-    def test_single_quote_escaped(self):
-        assert sql_like("O'Brien") == "'O''Brien'"
-
-    def test_injection_escaped(self):
-        result = sql_like("'; DROP TABLE users; --")
-        assert result == "'''; DROP TABLE users; --'"
-
-
-class TestSqlLikeStart:
-    def test_suffix_percent(self):
-        assert sql_like_start("ab") == "'ab%'"
-
-    def test_escape(self):
-        assert "\\%" in sql_like_start("a%") and sql_like_start("a%").endswith("%'")
-
-    def test_single_quote_escaped(self):
-        assert sql_like_start("O'Brien") == "'O''Brien%'"
-
-    def test_injection_escaped(self):
-        result = sql_like_start("'; DROP TABLE users; --")
-        assert result == "'''; DROP TABLE users; --%'"
-
-
-class TestSqlLikeEnd:
-    def test_prefix_percent(self):
-        assert sql_like_end("ab") == "'%ab'"
-
-    def test_single_quote_escaped(self):
-        assert sql_like_end("O'Brien") == "'%O''Brien'"
-
-    def test_injection_escaped(self):
-        result = sql_like_end("'; DROP TABLE users; --")
-        assert result == "'%''; DROP TABLE users; --'"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ([], "(SELECT 1 WHERE 1=0)"),
+            ([1, 2, 3], "(1, 2, 3)"),
+            ([1, "a", None], "(1, 'a', NULL)"),
+            (["o'brien"], "('o''brien')"),
+        ],
+        ids=["empty", "ints", "mixed", "quote_escape"],
+    )
+    def test_render(self, value, expected):
+        assert in_list(value) == expected
+
+
+class TestSqlLikeFamily:
+    """sql_like / sql_like_start / sql_like_end share escaping rules."""
+
+    @pytest.mark.parametrize(
+        ("fn", "value", "expected"),
+        [
+            (sql_like, "a%b", "'a\\%b'"),
+            (sql_like, "a_b", "'a\\_b'"),
+            (sql_like, "O'Brien", "'O''Brien'"),
+            (sql_like, "'; DROP TABLE users; --", "'''; DROP TABLE users; --'"),
+            (sql_like_start, "ab", "'ab%'"),
+            (sql_like_start, "a%", "'a\\%%'"),
+            (sql_like_start, "O'Brien", "'O''Brien%'"),
+            (sql_like_start, "'; DROP TABLE users; --", "'''; DROP TABLE users; --%'"),
+            (sql_like_end, "ab", "'%ab'"),
+            (sql_like_end, "O'Brien", "'%O''Brien'"),
+            (sql_like_end, "'; DROP TABLE users; --", "'%''; DROP TABLE users; --'"),
+        ],
+        ids=[
+            "like-escape_percent",
+            "like-escape_underscore",
+            "like-single_quote_escaped",
+            "like-injection_escaped",
+            "start-suffix_percent",
+            "start-escape",
+            "start-single_quote_escaped",
+            "start-injection_escaped",
+            "end-prefix_percent",
+            "end-single_quote_escaped",
+            "end-injection_escaped",
+        ],
+    )
+    def test_render(self, fn, value, expected):
+        assert fn(value) == expected
 
 
 class TestSqlDatetimeEscape:
@@ -175,26 +189,35 @@ class TestSqlDatetimeEscape:
 class TestSqlFinalize:
     """Auto-escape finalize callback used by Jinja2 Environment."""
 
-    def test_safe_passthrough(self):
-        safe = SqlSafe("'already escaped'")
-        assert sql_finalize(safe) == "'already escaped'"
-
-    def test_none(self):
-        assert sql_finalize(None) == "NULL"
-
-    def test_bool(self):
-        assert sql_finalize(True) == "TRUE"
-        assert sql_finalize(False) == "FALSE"
-
-    def test_int(self):
-        assert sql_finalize(42) == "42"
-
-    def test_float(self):
-        assert sql_finalize(3.14) == "3.14"
-
-    def test_string_auto_escape(self):
-        result = sql_finalize("hello")
-        assert result == "'hello'"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (SqlSafe("'already escaped'"), "'already escaped'"),
+            (None, "NULL"),
+            (True, "TRUE"),
+            (False, "FALSE"),
+            (42, "42"),
+            (3.14, "3.14"),
+            ("hello", "'hello'"),
+            ([1, 2, 3], "(1, 2, 3)"),
+            (date(2025, 6, 1), "'2025-06-01'"),
+            (datetime(2025, 6, 1, 12, 0), "'2025-06-01T12:00:00'"),
+        ],
+        ids=[
+            "safe_passthrough",
+            "none",
+            "true",
+            "false",
+            "int",
+            "float",
+            "string_auto_escape",
+            "list",
+            "date",
+            "datetime",
+        ],
+    )
+    def test_render(self, value, expected):
+        assert sql_finalize(value) == expected
 
     def test_string_injection_auto_escape(self):
         result = sql_finalize("'; DROP TABLE users; --")
@@ -203,19 +226,10 @@ class TestSqlFinalize:
         assert result.startswith("'")
         assert result.endswith("'")
 
-    def test_list(self):
-        assert sql_finalize([1, 2, 3]) == "(1, 2, 3)"
-
     def test_dict_json(self):
         result = sql_finalize({"key": "val"})
         assert "'key'" in result or '"key"' in result
 
-    def test_date(self):
-        assert sql_finalize(date(2025, 6, 1)) == "'2025-06-01'"
-
-    def test_datetime(self):
-        assert sql_finalize(datetime(2025, 6, 1, 12, 0)) == "'2025-06-01T12:00:00'"
-
 
 class TestFromjson:
     def test_none(self):
@@ -242,9 +256,6 @@ class TestFromjson:
 class TestCompare:
     """Tests for the compare filter."""
 
-    def test_none(self):
-        assert compare(None) == ""
-
     def test_returns_sqlsafe(self):
         result = compare('{"combinator": ">", "values": "100"}')
         assert isinstance(result, SqlSafe)
@@ -335,9 +346,6 @@ class TestSqlIdent:
     def test_returns_sqlsafe(self):
         assert isinstance(sql_ident("col"), SqlSafe)
 
-    def test_none(self):
-        assert sql_ident(None) == ""
-
     def test_empty(self):
         assert sql_ident("") == ""
 
@@ -50,3 +50,23 @@ class TestCheckSqlTemplateSafety:
     def test_unknown_filter_warns(self):
         warnings = check_sql_template_safety("{{ x | totally_unknown }}")
         assert len(warnings) == 1
+
+    def test_attribute_access_reports_root_name(self):
+        warnings = check_sql_template_safety("{{ user.name }} {{ row['id'] }}")
+        assert [w["variable"] for w in warnings] == ["user", "row"]
+
+    def test_expression_spanning_lines(self):
+        warnings = check_sql_template_safety("SELECT\n{{\n  name\n}}")
+        assert [(w["variable"], w["line"]) for w in warnings] == [("name", 3)]
+
+    def test_nested_in_where_block(self):
+        sql = "{% where %}AND a = {{ a }} AND b = {{ b | sql_int }}{% endwhere %}"
+        warnings = check_sql_template_safety(sql)
+        assert [w["variable"] for w in warnings] == ["a"]
+
+    def test_constant_not_flagged(self):
+        assert check_sql_template_safety("{{ 1 }} {{ 'x' }}") == []
+
+    def test_unparsable_template_falls_back_to_line_scan(self):
+        warnings = check_sql_template_safety("{% if %}{{ name }}")
+        assert [w["variable"] for w in warnings] == ["name"]
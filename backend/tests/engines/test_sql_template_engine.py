@@ -1,77 +1,81 @@
 """Unit tests for engines.sql.template_engine (Phase 3, Task 3.2)."""
 
-from app.engines.sql import SQLTemplateEngine, parse_parameters
+import pytest
+from jinja2 import TemplateSyntaxError
+
+from app.engines.sql import (
+    SQLTemplateEngine,
+    check_sql_template_safety,
+    parse_parameters,
+)
+from app.engines.sql.template_engine import clear_template_caches, parse_sql_template
+
+
+@pytest.fixture(scope="module")
+def engine() -> SQLTemplateEngine:
+    return SQLTemplateEngine()
 
 
 class TestSQLTemplateEngineRender:
-    def test_simple_int_var(self):
-        e = SQLTemplateEngine()
-        assert e.render("SELECT {{ x }}", {"x": 1}) == "SELECT 1"
+    def test_simple_int_var(self, engine):
+        assert engine.render("SELECT {{ x }}", {"x": 1}) == "SELECT 1"
 
-    def test_filter_int(self):
-        e = SQLTemplateEngine()
-        assert e.render("WHERE id = {{ id | sql_int }}", {"id": 5}) == "WHERE id = 5"
+    def test_filter_int(self, engine):
+        assert (
+            engine.render("WHERE id = {{ id | sql_int }}", {"id": 5}) == "WHERE id = 5"
+        )
 
-    def test_if(self):
-        e = SQLTemplateEngine()
+    def test_if(self, engine):
         t = "SELECT 1{% if name %} WHERE name = {{ name }}{% endif %}"
-        assert e.render(t, {"name": "a"}) == "SELECT 1 WHERE name = 'a'"
-        assert e.render(t, {}) == "SELECT 1"
+        assert engine.render(t, {"name": "a"}) == "SELECT 1 WHERE name = 'a'"
+        assert engine.render(t, {}) == "SELECT 1"
 
-    def test_in_list(self):
-        e = SQLTemplateEngine()
+    def test_in_list(self, engine):
         assert (
-            e.render("WHERE id IN {{ ids | in_list }}", {"ids": [1, 2, 3]})
+            engine.render("WHERE id IN {{ ids | in_list }}", {"ids": [1, 2, 3]})
             == "WHERE id IN (1, 2, 3)"
         )
 
-    def test_where_extension(self):
-        e = SQLTemplateEngine()
+    def test_where_extension(self, engine):
         t = "SELECT * FROM t {% where %}\n  AND a = 1\n{% endwhere %}"
-        out = e.render(t, {})
+        out = engine.render(t, {})
         assert "WHERE" in out and "a = 1" in out
         assert out.strip().startswith("SELECT")
 
-    def test_where_operation_and(self):
-        e = SQLTemplateEngine()
+    def test_where_operation_and(self, engine):
         t = 'SELECT * FROM t {% where operation="AND" %}\n  AND a = 1\n  AND b = 2\n{% endwhere %}'
-        out = e.render(t, {})
+        out = engine.render(t, {})
         assert "WHERE a = 1 AND b = 2" in out
 
-    def test_where_operation_or(self):
-        e = SQLTemplateEngine()
+    def test_where_operation_or(self, engine):
         t = 'SELECT * FROM t {% where operation="OR" %}\n  AND a = 1\n  AND b = 2\n{% endwhere %}'
-        out = e.render(t, {})
+        out = engine.render(t, {})
         assert "WHERE a = 1 OR b = 2" in out
 
-    def test_where_operation_or_single_condition(self):
-        e = SQLTemplateEngine()
+    def test_where_operation_or_single_condition(self, engine):
         t = 'SELECT * FROM t {% where operation="OR" %}\n  AND a = 1\n{% endwhere %}'
-        out = e.render(t, {})
+        out = engine.render(t, {})
         assert "WHERE a = 1" in out
 
-    def test_where_operation_or_empty(self):
-        e = SQLTemplateEngine()
+    def test_where_operation_or_empty(self, engine):
         t = 'SELECT * FROM t {% where operation="OR" %}{% endwhere %}'
-        out = e.render(t, {})
+        out = engine.render(t, {})
         assert "WHERE" not in out
 
-    def test_where_default_operation_is_and(self):
-        e = SQLTemplateEngine()
+    def test_where_default_operation_is_and(self, engine):
         t = "SELECT * FROM t {% where %}\n  AND a = 1\n  AND b = 2\n{% endwhere %}"
-        out = e.render(t, {})
+        out = engine.render(t, {})
         assert "WHERE a = 1" in out
         assert "AND b = 2" in out
 
-    def test_where_operation_or_with_conditional(self):
-        e = SQLTemplateEngine()
+    def test_where_operation_or_with_conditional(self, engine):
         t = (
             '{% where operation="OR" %}\n'
             "{% if x %}AND x = {{ x }}{% endif %}\n"
             "{% if y %}AND y = {{ y }}{% endif %}\n"
             "{% endwhere %}"
         )
-        out = e.render(t, {"x": 1, "y": 2})
+        out = engine.render(t, {"x": 1, "y": 2})
         assert "WHERE" in out
         assert "OR" in out
         assert "AND" not in out.split("WHERE", 1)[1]
@@ -80,47 +84,41 @@ class TestSQLTemplateEngineRender:
 class TestSQLTemplateEngineAutoEscape:
     """Verify the finalize auto-escape prevents SQL injection."""
 
-    def test_string_auto_escaped(self):
-        e = SQLTemplateEngine()
-        result = e.render("SELECT {{ name }}", {"name": "hello"})
+    def test_string_auto_escaped(self, engine):
+        result = engine.render("SELECT {{ name }}", {"name": "hello"})
         assert result == "SELECT 'hello'"
 
-    def test_injection_neutralised(self):
-        e = SQLTemplateEngine()
+    def test_injection_neutralised(self, engine):
         payload = "'; DROP TABLE users; --"
-        result = e.render("SELECT {{ name }}", {"name": payload})
+        result = engine.render("SELECT {{ name }}", {"name": payload})
         assert "DROP TABLE" in result
         assert result.startswith("SELECT '")
         assert "'';" in result
 
-    def test_int_not_quoted(self):
-        e = SQLTemplateEngine()
-        assert e.render("WHERE id = {{ id }}", {"id": 42}) == "WHERE id = 42"
+    def test_int_not_quoted(self, engine):
+        assert engine.render("WHERE id = {{ id }}", {"id": 42}) == "WHERE id = 42"
 
-    def test_bool_rendered(self):
-        e = SQLTemplateEngine()
+    def test_bool_rendered(self, engine):
         assert (
-            e.render("WHERE active = {{ flag }}", {"flag": True})
+            engine.render("WHERE active = {{ flag }}", {"flag": True})
             == "WHERE active = TRUE"
         )
 
-    def test_none_renders_null(self):
-        e = SQLTemplateEngine()
-        assert e.render("WHERE x = {{ val }}", {"val": None}) == "WHERE x = NULL"
+    def test_none_renders_null(self, engine):
+        assert engine.render("WHERE x = {{ val }}", {"val": None}) == "WHERE x = NULL"
 
-    def test_list_auto_in_list(self):
-        e = SQLTemplateEngine()
-        result = e.render("WHERE id IN {{ ids }}", {"ids": [1, 2, 3]})
+    def test_list_auto_in_list(self, engine):
+        result = engine.render("WHERE id IN {{ ids }}", {"ids": [1, 2, 3]})
         assert result == "WHERE id IN (1, 2, 3)"
 
-    def test_explicit_filter_not_double_escaped(self):
-        e = SQLTemplateEngine()
-        result = e.render("WHERE name = {{ name | sql_string }}", {"name": "hello"})
+    def test_explicit_filter_not_double_escaped(self, engine):
+        result = engine.render(
+            "WHERE name = {{ name | sql_string }}", {"name": "hello"}
+        )
         assert result == "WHERE name = 'hello'"
 
-    def test_sql_datetime_string_escaped(self):
-        e = SQLTemplateEngine()
-        result = e.render(
+    def test_sql_datetime_string_escaped(self, engine):
+        result = engine.render(
             "WHERE ts = {{ dt | sql_datetime }}",
             {"dt": "2024-01-01'; DROP TABLE x; --"},
         )
@@ -129,24 +127,43 @@ class TestSQLTemplateEngineAutoEscape:
 
 
 class TestSQLTemplateEngineParseParameters:
-    def test_vars(self):
-        e = SQLTemplateEngine()
-        assert e.parse_parameters("{{ a }}") == ["a"]
-        assert e.parse_parameters("{{ a }} and {{ b }}") == ["a", "b"]
-
-    def test_with_filter(self):
-        e = SQLTemplateEngine()
-        assert e.parse_parameters("{{ ids | in_list }}") == ["ids"]
-
-    def test_if_block(self):
-        e = SQLTemplateEngine()
-        assert "name" in e.parse_parameters("{% if name %}x{{ name }}{% endif %}")
-
-    def test_loop(self):
-        e = SQLTemplateEngine()
-        names = e.parse_parameters("{% for x in items %}{{ x }}{% endfor %}")
+    def test_vars(self, engine):
+        assert engine.parse_parameters("{{ a }}") == ["a"]
+        assert engine.parse_parameters("{{ a }} and {{ b }}") == ["a", "b"]
+
+    def test_with_filter(self, engine):
+        assert engine.parse_parameters("{{ ids | in_list }}") == ["ids"]
+
+    def test_if_block(self, engine):
+        assert "name" in engine.parse_parameters("{% if name %}x{{ name }}{% endif %}")
+
+    def test_loop(self, engine):
+        names = engine.parse_parameters("{% for x in items %}{{ x }}{% endfor %}")
         assert "items" in names
 
+    def test_cached_result_is_not_shared(self, engine):
+        first = engine.parse_parameters("{{ cached_p }} {{ cached_q }}")
+        first.append("mutated")
+        assert engine.parse_parameters("{{ cached_p }} {{ cached_q }}") == [
+            "cached_p",
+            "cached_q",
+        ]
+
+    def test_ast_is_parsed_once_and_shared(self, engine):
+        src = "SELECT {{ shared_ast_p }}"
+        clear_template_caches()
+        ast = parse_sql_template(src)
+        assert engine.parse_parameters(src) == ["shared_ast_p"]
+        assert check_sql_template_safety(src)[0]["variable"] == "shared_ast_p"
+        assert parse_sql_template(src) is ast
+        clear_template_caches()
+        assert parse_sql_template(src) is not ast
+
+    def test_syntax_error_still_raises_on_repeat(self, engine):
+        for _ in range(2):
+            with pytest.raises(TemplateSyntaxError):
+                engine.parse_parameters("{{ broken ")
+
 
 class TestParseParametersStandalone:
     def test_reexport(self):
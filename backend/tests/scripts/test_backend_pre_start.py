@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 from app.backend_pre_start import init, logger
 
@@ -14,9 +14,7 @@ def test_init_successful_connection() -> None:
 
     with (
         patch("app.backend_pre_start.Session", return_value=session_mock),
-        patch.object(logger, "info"),
-        patch.object(logger, "error"),
-        patch.object(logger, "warn"),
+        patch.multiple(logger, info=DEFAULT, error=DEFAULT, warn=DEFAULT),
     ):
         try:
             init(engine_mock)
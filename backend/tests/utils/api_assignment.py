@@ -1,6 +1,7 @@
 """Test helpers for ApiAssignment."""
 
 import uuid
+from typing import Any
 
 from sqlmodel import Session
 
@@ -11,13 +12,13 @@ from app.models_dbapi import (
     HttpMethodEnum,
 )
 from tests.utils.module import create_random_module
-from tests.utils.utils import random_lower_string
+from tests.utils.utils import persist, random_lower_string
 
 
-def create_random_assignment(
+def _stage_assignment(
     db: Session,
+    module_id: uuid.UUID,
     *,
-    module_id: uuid.UUID | None = None,
     name: str | None = None,
     path: str | None = None,
     http_method: HttpMethodEnum = HttpMethodEnum.GET,
@@ -28,10 +29,7 @@ def create_random_assignment(
     sort_order: int = 0,
     content: str | None = None,
 ) -> ApiAssignment:
-    """Create an ApiAssignment in the DB. Creates a module if module_id not given."""
-    if module_id is None:
-        mod = create_random_module(db)
-        module_id = mod.id
+    """Add an ApiAssignment (and its ApiContext) to the session without committing."""
     a = ApiAssignment(
         module_id=module_id,
         name=name or f"api-{random_lower_string()}",
@@ -44,10 +42,69 @@ def create_random_assignment(
         sort_order=sort_order,
     )
     db.add(a)
-    db.flush()
     if content is not None:
-        ctx = ApiContext(api_assignment_id=a.id, content=content)
-        db.add(ctx)
-    db.commit()
-    db.refresh(a)
+        # id is generated client-side, so no flush is needed before the FK row
+        db.add(ApiContext(api_assignment_id=a.id, content=content))
+    return a
+
+
+def create_random_assignment(
+    db: Session,
+    *,
+    module_id: uuid.UUID | None = None,
+    name: str | None = None,
+    path: str | None = None,
+    http_method: HttpMethodEnum = HttpMethodEnum.GET,
+    execute_engine: ExecuteEngineEnum = ExecuteEngineEnum.SQL,
+    datasource_id: uuid.UUID | None = None,
+    description: str | None = None,
+    is_published: bool = False,
+    sort_order: int = 0,
+    content: str | None = None,
+    commit: bool = True,
+) -> ApiAssignment:
+    """Create an ApiAssignment in the DB. Creates a module if module_id not given.
+
+    The module and assignment are committed together; with ``commit=False``
+    they are only flushed.
+    """
+    if module_id is None:
+        mod = create_random_module(db, commit=False)
+        module_id = mod.id
+    a = _stage_assignment(
+        db,
+        module_id,
+        name=name,
+        path=path,
+        http_method=http_method,
+        execute_engine=execute_engine,
+        datasource_id=datasource_id,
+        description=description,
+        is_published=is_published,
+        sort_order=sort_order,
+        content=content,
+    )
+    persist(db, a, commit=commit)
     return a
+
+
+def create_random_assignments(
+    db: Session, specs: list[dict[str, Any]]
+) -> list[ApiAssignment]:
+    """Create several ApiAssignments with one commit.
+
+    Each spec takes ``create_random_assignment`` keyword arguments; specs
+    without ``module_id`` share one newly created module.
+    """
+    shared_module_id: uuid.UUID | None = None
+    created: list[ApiAssignment] = []
+    for spec in specs:
+        kwargs = dict(spec)
+        module_id = kwargs.pop("module_id", None)
+        if module_id is None:
+            if shared_module_id is None:
+                shared_module_id = create_random_module(db, commit=False).id
+            module_id = shared_module_id
+        created.append(_stage_assignment(db, module_id, **kwargs))
+    db.commit()
+    return created
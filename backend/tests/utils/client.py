@@ -1,31 +1,74 @@
 """Test helpers for AppClient."""
 
+import functools
 import secrets
+from typing import Any
 
 from sqlmodel import Session
 
 from app.core.security import get_password_hash
 from app.models_dbapi import AppClient
-from tests.utils.utils import random_lower_string
+from tests.utils.utils import persist, random_lower_string
 
 
-def create_random_client(
-    db: Session,
+@functools.cache
+def _shared_secret_hash() -> str:
+    """One hashed secret reused by every client (hashing is slow by design)."""
+    return get_password_hash(secrets.token_urlsafe(24))
+
+
+def _build_client(
     *,
     name: str | None = None,
     description: str | None = None,
     is_active: bool = True,
+    hash_secret: bool = False,
 ) -> AppClient:
-    """Create an AppClient in the DB with generated client_id and hashed secret."""
-    plain_secret = secrets.token_urlsafe(24)
-    c = AppClient(
+    return AppClient(
         name=name or f"client-{random_lower_string()}",
         client_id=secrets.token_urlsafe(16),
-        client_secret=get_password_hash(plain_secret),
+        client_secret=(
+            get_password_hash(secrets.token_urlsafe(24))
+            if hash_secret
+            else _shared_secret_hash()
+        ),
         description=description,
         is_active=is_active,
     )
-    db.add(c)
-    db.commit()
-    db.refresh(c)
+
+
+def create_random_client(
+    db: Session,
+    *,
+    name: str | None = None,
+    description: str | None = None,
+    is_active: bool = True,
+    commit: bool = True,
+    refresh: bool = False,
+    hash_secret: bool = False,
+) -> AppClient:
+    """Create an AppClient in the DB with generated client_id and hashed secret.
+
+    The secret hash is shared between clients unless ``hash_secret`` is set.
+    """
+    c = _build_client(
+        name=name,
+        description=description,
+        is_active=is_active,
+        hash_secret=hash_secret,
+    )
+    persist(db, c, commit=commit, refresh=refresh)
     return c
+
+
+def create_random_clients(db: Session, specs: list[dict[str, Any]]) -> list[AppClient]:
+    """Create several AppClients with one commit.
+
+    Each spec takes ``create_random_client`` field keyword arguments (``name``,
+    ``description``, ``is_active``, ``hash_secret``); the rows are flushed as
+    one batched INSERT.
+    """
+    created = [_build_client(**spec) for spec in specs]
+    db.add_all(created)
+    db.commit()
+    return created
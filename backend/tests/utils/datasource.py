@@ -5,7 +5,7 @@ from sqlmodel import Session
 from app.core.config import settings
 from app.core.security import encrypt_value
 from app.models_dbapi import DataSource, ProductTypeEnum
-from tests.utils.utils import random_lower_string
+from tests.utils.utils import persist, random_lower_string
 
 
 def create_random_datasource(
@@ -19,6 +19,7 @@ def create_random_datasource(
     username: str | None = None,
     password: str | None = None,
     is_active: bool = True,
+    commit: bool = True,
 ) -> DataSource:
     """Create a DataSource in the DB. Uses app Postgres settings by default so test/test and preTest can connect.
 
@@ -36,7 +37,5 @@ def create_random_datasource(
         password=encrypt_value(raw_pw),
         is_active=is_active,
     )
-    db.add(ds)
-    db.commit()
-    db.refresh(ds)
+    persist(db, ds, commit=commit)
     return ds
@@ -3,7 +3,7 @@
 from sqlmodel import Session
 
 from app.models_dbapi import ApiGroup
-from tests.utils.utils import random_lower_string
+from tests.utils.utils import persist, random_lower_string
 
 
 def create_random_group(
@@ -12,6 +12,8 @@ def create_random_group(
     name: str | None = None,
     description: str | None = None,
     is_active: bool = True,
+    commit: bool = True,
+    refresh: bool = False,
 ) -> ApiGroup:
     """Create an ApiGroup in the DB."""
     g = ApiGroup(
@@ -19,7 +21,5 @@ def create_random_group(
         description=description,
         is_active=is_active,
     )
-    db.add(g)
-    db.commit()
-    db.refresh(g)
+    persist(db, g, commit=commit, refresh=refresh)
     return g
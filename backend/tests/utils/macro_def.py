@@ -5,7 +5,7 @@ import uuid
 from sqlmodel import Session
 
 from app.models_dbapi import ApiMacroDef, MacroTypeEnum
-from tests.utils.utils import random_lower_string
+from tests.utils.utils import persist, random_lower_string
 
 
 def create_random_macro_def(
@@ -16,6 +16,7 @@ def create_random_macro_def(
     macro_type: MacroTypeEnum = MacroTypeEnum.JINJA,
     content: str = "{% macro test_macro() %}SELECT 1{% endmacro %}",
     description: str | None = None,
+    commit: bool = True,
 ) -> ApiMacroDef:
     """Create an ApiMacroDef in the DB."""
     m = ApiMacroDef(
@@ -25,7 +26,5 @@ def create_random_macro_def(
         content=content,
         description=description,
     )
-    db.add(m)
-    db.commit()
-    db.refresh(m)
+    persist(db, m, commit=commit)
     return m
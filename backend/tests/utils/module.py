@@ -3,7 +3,7 @@
 from sqlmodel import Session
 
 from app.models_dbapi import ApiModule
-from tests.utils.utils import random_lower_string
+from tests.utils.utils import persist, random_lower_string
 
 
 def create_random_module(
@@ -13,6 +13,8 @@ def create_random_module(
     description: str | None = None,
     sort_order: int = 0,
     is_active: bool = True,
+    commit: bool = True,
+    refresh: bool = False,
 ) -> ApiModule:
     """Create an ApiModule in the DB."""
     m = ApiModule(
@@ -21,7 +23,5 @@ def create_random_module(
         sort_order=sort_order,
         is_active=is_active,
     )
-    db.add(m)
-    db.commit()
-    db.refresh(m)
+    persist(db, m, commit=commit, refresh=refresh)
     return m
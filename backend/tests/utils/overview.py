@@ -5,7 +5,7 @@ import uuid
 from sqlmodel import Session
 
 from app.models_dbapi import AccessRecord, VersionCommit
-from tests.utils.utils import random_lower_string
+from tests.utils.utils import persist, random_lower_string
 
 
 def create_random_access_record(
@@ -19,6 +19,7 @@ def create_random_access_record(
     status_code: int = 200,
     request_body: str | None = None,
     duration_ms: int | None = None,
+    commit: bool = True,
 ) -> AccessRecord:
     """Create an AccessRecord in the DB."""
     r = AccessRecord(
@@ -26,14 +27,12 @@ def create_random_access_record(
         app_client_id=app_client_id,
         ip_address=ip_address,
         http_method=http_method,
-        path=path or f"/api/{random_lower_string()[:8]}",
+        path=path or f"/api/{random_lower_string(8)}",
         status_code=status_code,
         request_body=request_body,
         duration_ms=duration_ms,
     )
-    db.add(r)
-    db.commit()
-    db.refresh(r)
+    persist(db, r, commit=commit)
     return r
 
 
@@ -44,15 +43,14 @@ def create_random_version_commit(
     content_snapshot: str | None = None,
     version: int = 1,
     commit_message: str | None = None,
+    commit: bool = True,
 ) -> VersionCommit:
     """Create a VersionCommit in the DB. Requires api_assignment_id."""
     v = VersionCommit(
         api_assignment_id=api_assignment_id,
         content_snapshot=content_snapshot or "SELECT 1",
         version=version,
-        commit_message=commit_message or f"commit-{random_lower_string()[:8]}",
+        commit_message=commit_message or f"commit-{random_lower_string(8)}",
     )
-    db.add(v)
-    db.commit()
-    db.refresh(v)
+    persist(db, v, commit=commit)
     return v
@@ -3,7 +3,7 @@
 from sqlmodel import Session
 
 from app.models_permission import Role
-from tests.utils.utils import random_lower_string
+from tests.utils.utils import persist, random_lower_string
 
 
 def create_random_role(
@@ -11,13 +11,12 @@ def create_random_role(
     *,
     name: str | None = None,
     description: str | None = None,
+    commit: bool = True,
 ) -> Role:
     """Create a Role in the DB."""
     r = Role(
         name=name or f"role-{random_lower_string()}",
         description=description,
     )
-    db.add(r)
-    db.commit()
-    db.refresh(r)
+    persist(db, r, commit=commit)
     return r
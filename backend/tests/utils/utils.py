@@ -1,13 +1,44 @@
+import itertools
 import random
+import secrets
 import string
+import uuid
 
 from fastapi.testclient import TestClient
+from sqlmodel import Session
 
 from app.core.config import settings
 
 
-def random_lower_string() -> str:
-    return "".join(random.choices(string.ascii_lowercase, k=32))
+def random_lower_string(length: int = 32) -> str:
+    """Random lowercase hex string of *length* characters."""
+    return secrets.token_hex((length + 1) // 2)[:length]
+
+
+_uuid_counter = itertools.count(1)
+
+
+def sequential_uuid() -> uuid.UUID:
+    """Unique id for objects that never reach the database (no urandom read)."""
+    return uuid.UUID(int=next(_uuid_counter))
+
+
+def persist(
+    db: Session, obj: object, *, commit: bool = True, refresh: bool = True
+) -> None:
+    """Add *obj* and, with ``refresh``, reload it from the database.
+
+    With ``commit=False`` the row is only flushed, so a caller building a
+    fixture graph can commit it once at the end.  Models whose defaults are
+    all generated client-side can skip the reload SELECT (``refresh=False``).
+    """
+    db.add(obj)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+    if refresh:
+        db.refresh(obj)
 
 
 def random_email() -> str:
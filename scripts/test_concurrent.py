@@ -15,34 +15,47 @@ Usage:
 """
 
 import argparse
+import asyncio
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
-    import requests
+    import httpx
 except ImportError:
-    print("Install requests: pip install requests", file=sys.stderr)
+    print("Install httpx: pip install httpx", file=sys.stderr)
     sys.exit(1)
 
 
-def do_request(
+async def do_request(
+    client: httpx.AsyncClient,
     url: str,
-    token: str,
     index: int,
 ) -> tuple[int, int]:
     """Send one GET request; return (index, status_code)."""
     try:
-        r = requests.get(
-            url,
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=30,
-        )
+        r = await client.get(url)
         return (index, r.status_code)
     except Exception:
         return (index, -1)  # -1 = error
 
 
+async def run_requests(url: str, token: str, n: int) -> list[tuple[int, int]]:
+    """Fire *n* GETs at once on one event loop; print each as it completes."""
+    results: list[tuple[int, int]] = []
+    async with httpx.AsyncClient(
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=30,
+        limits=httpx.Limits(max_connections=n, max_keepalive_connections=n),
+    ) as client:
+        tasks = [do_request(client, url, i) for i in range(1, n + 1)]
+        for fut in asyncio.as_completed(tasks):
+            idx, code = await fut
+            results.append((idx, code))
+            code_str = str(code) if code >= 0 else "ERR"
+            print(f"{idx} HTTP {code_str}")
+    return results
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Test gateway concurrent limit with N parallel requests."
@@ -74,17 +87,7 @@ def main() -> None:
     print(f"Testing {args.concurrent} concurrent GET requests to {args.url}")
     print("---")
 
-    results: list[tuple[int, int]] = []
-    with ThreadPoolExecutor(max_workers=args.concurrent) as executor:
-        futures = {
-            executor.submit(do_request, args.url, args.token, i): i
-            for i in range(1, args.concurrent + 1)
-        }
-        for fut in as_completed(futures):
-            idx, code = fut.result()
-            results.append((idx, code))
-            code_str = str(code) if code >= 0 else "ERR"
-            print(f"{idx} HTTP {code_str}")
+    results = asyncio.run(run_requests(args.url, args.token, args.concurrent))
 
     results.sort(key=lambda x: x[0])
     print("---")